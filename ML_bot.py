@@ -3,14 +3,17 @@ This module implements a Q-learning bot for Limit Hold'em poker.
 It includes functions for hand evaluation, action selection, and Q-learning updates.
 """
 
+import atexit
+import functools
+import itertools
 import random
 import json
 import os
 import logging
+import weakref
 
 import numpy as np
-from hand_evaluator import eval5, eval6, eval7
-from view import PokerView
+from hand_evaluator import eval5, eval6, eval7, DECK
 
 # Set up logging
 logging.basicConfig(
@@ -63,6 +66,9 @@ def load_preflop_data():
 
 PREFLOP_LOOKUP = load_preflop_data()
 
+# Shorthand rank character -> sort position, lowest rank first
+RANK_ORDER = {rank: order for order, rank in enumerate("23456789tjqka")}
+
 
 def canonicalize(hand):
     """
@@ -106,7 +112,7 @@ def canonicalize(hand):
     mapped_ranks = [rank_map.get(rank, "x") for rank in ranks]
 
     # Sort ranks
-    sorted_ranks = sorted(mapped_ranks, key=lambda r: "23456789tjqka".index(r))
+    sorted_ranks = sorted(mapped_ranks, key=RANK_ORDER.__getitem__)
 
     # Check if suited
     suited = suits[0] == suits[1]
@@ -119,6 +125,62 @@ def canonicalize(hand):
     return key
 
 
+# Card string -> dense id, used to index the preflop table below
+CARD_IDS = {card: card_id for card_id, card in enumerate(DECK)}
+
+
+def _build_preflop_rank():
+    """
+    Precompute preflop ranks for every two-card combination.
+
+    Runs the canonicalize + PREFLOP_LOOKUP work once per pair at import
+    time (1326 entries) and stores the results in a 52x52 float32 array
+    (10 KB, so it stays cache-resident), indexed by CARD_IDS in either
+    card order. Preflop get_hand_rank calls become a single array load
+    instead of string splitting and sorting on every action.
+
+    Returns:
+        np.ndarray: 52x52 float32 table of preflop ranks scaled to the
+                    postflop score range; the diagonal (impossible
+                    duplicate-card pairs) holds the mid-range fallback.
+    """
+    table = np.full((52, 52), 0.5 * 7462, dtype=np.float32)
+    for card_a, card_b in itertools.combinations(DECK, 2):
+        key = canonicalize([card_a, card_b])
+        rank = (1.0 - PREFLOP_LOOKUP.get(key, 0.5)) * 7462
+        id_a, id_b = CARD_IDS[card_a], CARD_IDS[card_b]
+        table[id_a, id_b] = rank
+        table[id_b, id_a] = rank
+    return table
+
+
+PREFLOP_RANK = _build_preflop_rank()
+
+
+@functools.lru_cache(maxsize=4096)
+def _eval_cached(hand_key, community_key):
+    """
+    Evaluate a postflop hand, caching by its sorted card tuples.
+
+    bot_action can run several times per betting round (once per raise)
+    with identical cards; evaluation is pure, so repeat calls become a
+    cache hit and old hands simply age out of the LRU.
+
+    Args:
+        hand_key (tuple of str): Sorted hole cards.
+        community_key (tuple of str): Sorted community cards.
+
+    Returns:
+        int: Hand strength from eval5/eval6/eval7 (lower is better).
+    """
+    full = list(hand_key) + list(community_key)
+    if len(full) == 5:
+        return eval5(full)
+    if len(full) == 6:
+        return eval6(full)
+    return eval7(full)
+
+
 def get_hand_rank(hand, community):
     """
     Evaluate the strength of a poker hand given the community cards.
@@ -139,18 +201,11 @@ def get_hand_rank(hand, community):
     """
     try:
         if len(community) == 0:
-            key = canonicalize(hand)
-            return (
-                1.0 - PREFLOP_LOOKUP.get(key, 0.5)
-            ) * 7462  # normalize to match postflop scale
-
-        full = hand + community
-        if len(full) == 5:
-            return eval5(full)
-        elif len(full) == 6:
-            return eval6(full)
-        else:
-            return eval7(full)
+            # Precomputed 52x52 table lookup; already scaled to match
+            # the postflop score range
+            return float(PREFLOP_RANK[CARD_IDS[hand[0]], CARD_IDS[hand[1]]])
+
+        return _eval_cached(tuple(sorted(hand)), tuple(sorted(community)))
     except Exception as error:
         print(f"Error in get_hand_rank: {error}")
         print(f"Hand: {hand}")
@@ -159,11 +214,56 @@ def get_hand_rank(hand, community):
         return 0.5 * 7462
 
 
+# Street encoding shared by bot_action; index doubles as the street number
+_STREET_NAMES = ("preflop", "flop", "turn", "river")
+_STREETS = {name: street for street, name in enumerate(_STREET_NAMES)}
+
+# Betting state by ((bot_bet > 0) << 1) | (player_bet > 0); the equal
+# nonzero-bets case is corrected to state 2 after the lookup
+_BETTING_STATES = (0, 3, 1, 1)
+
+# Valid actions by (betting_state << 1) | raise_cap_reached, stored as
+# shared immutable tuples so lookups allocate nothing
+_VALID_ACTIONS = (
+    (1, 2),  # No bets yet
+    (1, 2),
+    (1, 2),  # Bot has bet, player hasn't
+    (1, 2),
+    (1,),  # Both have bet same amount
+    (1,),
+    (0, 1, 2),  # Player has bet, bot hasn't matched
+    (0, 1),  # ...and the raise cap is reached
+)
+
+
+# Q-tables already loaded in this process, keyed by save path. Extra
+# QBot instances with the same path and shape share the array directly
+# instead of re-parsing the JSON file per instance.
+_STRATEGY_CACHE = {}
+
+
+def _save_at_exit(bot_ref):
+    """Flush a bot's strategy at interpreter exit, if it still exists.
+
+    Takes a weak reference so the exit hook doesn't keep every QBot
+    ever constructed alive (and saving) for the life of the process.
+
+    Args:
+        bot_ref (weakref.ref): Weak reference to a QBot.
+    """
+    bot = bot_ref()
+    if bot is not None:
+        bot.save_strategy()
+
+
 def bot_bet_handling(self):
     """
-    Deducts the bot's bet difference from its chip stack and updates the previous bet amount.
+    Deducts the bot's bet difference from its chip stack, adds it to the
+    pot, and updates the previous bet amount.
     """
-    self.chips[self.players[1]] -= self.bot_bet - self.previous_bot_bet
+    delta = self.bot_bet - self.previous_bot_bet
+    self.chips[self.players[1]] -= delta
+    self.pot += delta
     self.previous_bot_bet = self.bot_bet
 
 
@@ -193,14 +293,38 @@ class QBot:
         """
         self.num_buckets = num_buckets
         self.num_states = 4 * num_buckets * 4  # street × bucket × betting_state
-        self.Q = np.zeros((self.num_states, 3))  # Initialize with zeros
+        # Precomputed rank→bucket table and encode_state stride
+        self._rank_to_bucket = np.minimum(
+            np.arange(7463) * num_buckets // 7462, num_buckets - 1
+        ).astype(np.int16)
+        self._street_stride = num_buckets * 4
+        # Full (street, rank, betting_state) → state index table, built
+        # with one broadcast; encode_state becomes a single indexed fetch
+        self._state_table = (
+            np.arange(4, dtype=np.int64).reshape(4, 1, 1) * self._street_stride
+            + (self._rank_to_bucket.astype(np.int64) * 4).reshape(1, -1, 1)
+            + np.arange(4, dtype=np.int64).reshape(1, 1, 4)
+        )
+        # float32 halves the table footprint with no loss that matters
+        # at these learning rates
+        self.Q = np.zeros((self.num_states, 3), dtype=np.float32)
         self.alpha = 0.1  # Learning rate
         self.gamma = 0.9  # Discount factor
         self.epsilon = 0.1  # Exploration rate
-        self.trajectory = []
+        # Trajectory stored as parallel arrays (SoA) instead of a list
+        # of (state, action) tuples; grown by doubling in record()
+        self._traj_states = np.empty(256, np.int32)
+        self._traj_actions = np.empty(256, np.int8)
+        self._traj_len = 0
         self.save_path = save_path
         self.games_played = 0
+        self._action_masks = {}  # Cache of valid-action masks for argmax
+        self.save_every = 100  # Hands between strategy file writes
         self.load_strategy()
+        # Flush any unsaved learning when the process exits; the weak
+        # reference lets short-lived bots be collected (and skipped)
+        # instead of being pinned by the hook
+        atexit.register(_save_at_exit, weakref.ref(self))
 
     def load_strategy(self):
         """
@@ -208,20 +332,31 @@ class QBot:
 
         If the file is not found or cannot be parsed, initializes the Q-table
         with small random values to encourage early exploration.
+
+        A table already loaded (or saved) in this process is reused from
+        the module cache when its shape matches, so repeat instantiation
+        skips the file read entirely.
         """
+        cached = _STRATEGY_CACHE.get(self.save_path)
+        if cached is not None and cached[0].shape == (self.num_states, 3):
+            self.Q, self.games_played = cached
+            return
         if os.path.exists(self.save_path):
             try:
                 with open(self.save_path, "r") as f:
                     data = json.load(f)
-                    self.Q = np.array(data["q_table"])
+                    self.Q = np.array(data["q_table"], dtype=np.float32)
                     self.games_played = data.get("games_played", 0)
+                    _STRATEGY_CACHE[self.save_path] = (self.Q, self.games_played)
                     print(
                         f"Strategy loaded from {self.save_path}. Games played: {self.games_played}"
                     )
             except Exception as e:
                 print(f"Error loading strategy: {e}. Using default values.")
                 # Initialize with slightly random values to avoid ties
-                self.Q = np.random.rand(self.num_states, 3) * 0.1
+                self.Q = (np.random.rand(self.num_states, 3) * 0.1).astype(
+                    np.float32
+                )
 
     def save_strategy(self):
         """
@@ -234,6 +369,8 @@ class QBot:
         try:
             with open(self.save_path, "w") as f:
                 json.dump(data, f)
+            # Keep the in-process cache in step with the file
+            _STRATEGY_CACHE[self.save_path] = (self.Q, self.games_played + 1)
             print(f"Strategy saved to {self.save_path}")
         except Exception as e:
             print(f"Error saving strategy: {e}")
@@ -250,8 +387,7 @@ class QBot:
         Returns:
             int: Encoded state index.
         """
-        bucket = self.get_bucket(rank)
-        return street * self.num_buckets * 4 + bucket * 4 + betting_state
+        return int(self._state_table[street, int(rank), betting_state])
 
     def get_bucket(self, rank):
         """
@@ -263,7 +399,7 @@ class QBot:
         Returns:
             int: Bucket index (0 to num_buckets - 1).
         """
-        return min(int((rank / 7462) * self.num_buckets), self.num_buckets - 1)
+        return int(self._rank_to_bucket[int(rank)])
 
     def get_valid_actions(self, betting_state, raise_cap_reached=False):
         """
@@ -274,18 +410,9 @@ class QBot:
             raise_cap_reached (bool): Whether the raise limit has been reached.
 
         Returns:
-            list[int]: A list of allowed actions [0=Fold, 1=Call/Check, 2=Raise].
+            tuple[int]: Allowed actions [0=Fold, 1=Call/Check, 2=Raise].
         """
-        if betting_state == 0:  # No bets yet
-            return [1, 2]  # Check (1) or Raise (2)
-        elif betting_state == 1:  # Bot has bet, player hasn't
-            return [1, 2]  # Check (1) or Raise (2)
-        elif betting_state == 2:  # Both have bet same amount
-            return [1]  # Check/Call (1)
-        elif betting_state == 3:  # Player has bet, bot hasn't matched
-            return (
-                [0, 1] if raise_cap_reached else [0, 1, 2]
-            )  # Fold (0), Call (1), or Raise (2)
+        return _VALID_ACTIONS[(betting_state << 1) | (1 if raise_cap_reached else 0)]
 
     def choose_action(self, state, valid_actions):
         """
@@ -304,9 +431,26 @@ class QBot:
         if random.random() < effective_epsilon:
             return random.choice(valid_actions)
 
-        q_values = self.Q[state]
-        masked = [q if i in valid_actions else -np.inf for i, q in enumerate(q_values)]
-        return int(np.argmax(masked))
+        # Add a cached mask (0 for valid, -inf for invalid) instead of
+        # rebuilding a Python list per call
+        key = tuple(valid_actions)
+        mask = self._action_masks.get(key)
+        if mask is None:
+            mask = np.full(3, -np.inf)
+            mask[list(valid_actions)] = 0.0
+            self._action_masks[key] = mask
+        return int(np.argmax(self.Q[state] + mask))
+
+    @property
+    def trajectory(self):
+        """Recorded (state, action) pairs for the current hand."""
+        return [
+            (int(state), int(action))
+            for state, action in zip(
+                self._traj_states[: self._traj_len],
+                self._traj_actions[: self._traj_len],
+            )
+        ]
 
     def record(self, state, action):
         """
@@ -316,21 +460,37 @@ class QBot:
             state (int): The current state.
             action (int): The chosen action in this state.
         """
-        self.trajectory.append((state, action))
+        if self._traj_len == len(self._traj_states):
+            self._traj_states = np.resize(self._traj_states, self._traj_len * 2)
+            self._traj_actions = np.resize(self._traj_actions, self._traj_len * 2)
+        self._traj_states[self._traj_len] = state
+        self._traj_actions[self._traj_len] = action
+        self._traj_len += 1
 
     def update(self, final_reward):
         """
         Update Q-values from the recorded trajectory using the final reward.
 
+        The strategy file is only rewritten every `save_every` hands (and
+        at process exit) instead of after every single update, since
+        serializing the whole Q-table dominates the learning work.
+
         Args:
             final_reward (float): The outcome reward of the game (e.g., net chips won).
         """
-        for t, (state, action) in enumerate(reversed(self.trajectory)):
-            discounted = final_reward * (self.gamma**t)
-            self.Q[state][action] += self.alpha * (discounted - self.Q[state][action])
-        self.trajectory.clear()
+        length = self._traj_len
+        if length:
+            states = self._traj_states[:length]
+            actions = self._traj_actions[:length]
+            # Last visit gets discount gamma^0, matching the old reversed loop
+            discounts = final_reward * self.gamma ** np.arange(length - 1, -1, -1)
+            deltas = self.alpha * (discounts - self.Q[states, actions])
+            # add.at accumulates correctly for repeated (state, action) pairs
+            np.add.at(self.Q, (states, actions), deltas)
+        self._traj_len = 0
         self.games_played += 1
-        self.save_strategy()
+        if self.games_played % self.save_every == 0:
+            self.save_strategy()
 
 
 def bot_action(self):
@@ -356,22 +516,9 @@ def bot_action(self):
     # Handle case sensitivity and variations in stage names
     stage_lower = self.stage.lower() if hasattr(self.stage, "lower") else "preflop"
 
-    # Map the stage to numeric values
-    if "pre" in stage_lower:
-        street = 0  # Preflop
-        round = "preflop"
-    elif "flop" in stage_lower:
-        street = 1  # Flop
-        round = "flop"
-    elif "turn" in stage_lower:
-        street = 2  # Turn
-        round = "turn"
-    elif "river" in stage_lower:
-        street = 3  # River
-        round = "river"
-    else:
-        street = 0  # Default to preflop
-        round = "preflop"
+    # Map the stage to its street number (default to preflop)
+    street = _STREETS.get(stage_lower, 0)
+    round = _STREET_NAMES[street]
 
     # Debug print for cards
     print(f"Bot hand: {self.bot_hand}")
@@ -384,15 +531,12 @@ def bot_action(self):
         print(f"Error getting hand rank: {e}")
         rank = 0.5 * 7462  # Default to middle rank
 
-    # Determine the current betting state
-    if self.bot_bet == 0 and self.player_bet == 0:
-        betting_state = 0  # No bets yet
-    elif self.bot_bet == 0 and self.player_bet > 0:
-        betting_state = 3  # Player has bet, bot hasn't matched
-    elif self.bot_bet > 0 and self.player_bet == self.bot_bet:
+    # Determine the current betting state via the lookup table
+    betting_state = _BETTING_STATES[
+        ((self.bot_bet > 0) << 1) | (self.player_bet > 0)
+    ]
+    if betting_state == 1 and self.player_bet == self.bot_bet:
         betting_state = 2  # Both have bet same amount
-    else:
-        betting_state = 1  # Bot has bet, player hasn't or hasn't matched
 
     state = self.bot.encode_state(street, rank, betting_state)
     valid = self.bot.get_valid_actions(
@@ -407,11 +551,11 @@ def bot_action(self):
     self.bot.record(state, action)
 
     if action == 0:
-        PokerView.display_bot_decision(self, "fold", round)
+        self.view.display_bot_decision("fold", round)
         print("Bot folds")
         return self.players[0]  # Bot folds, player wins
     elif action == 1:
-        PokerView.display_bot_decision(self, "check/call", round)
+        self.view.display_bot_decision("check/call", round)
         print("Bot checks/calls")
         self.bot_bet = self.player_bet
         self.current_bet = self.player_bet
@@ -419,7 +563,7 @@ def bot_action(self):
         return self.current_bet
     elif action == 2:
         raise_amount = self.get_current_bet_size()
-        PokerView.display_bot_decision(self, "raise", round, raise_amount)
+        self.view.display_bot_decision("raise", round, raise_amount)
         self.bot_bet = self.player_bet + raise_amount
         self.current_bet = self.bot_bet
         print(f"Bot raises to {self.bot_bet}")
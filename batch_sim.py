@@ -0,0 +1,75 @@
+"""Struct-of-arrays batch dealing for vectorized poker simulations."""
+
+import numpy as np
+
+from hand_evaluator import DECK, LOOKUP, eval7_batch
+
+# Encoded deck as an array so a deal is one fancy-indexing gather
+_ENCODED_DECK = np.array([LOOKUP[card] for card in DECK], dtype=np.int64)
+
+# Board columns filled by each street
+_STAGE_SLICES = {"flop": (0, 3), "turn": (3, 4), "river": (4, 5)}
+
+
+class BatchedDeals:
+    """Hole cards and boards for N independent games in SoA layout.
+
+    Each game gets an independent permutation of the deck, but the cards
+    live column-wise across games so dealing a street or scoring a
+    showdown is a single NumPy operation over all N games — the batched
+    counterpart of Model.deal_hands/deal_community_cards for Monte-Carlo
+    equity estimation and vectorized self-play.
+
+    Attributes:
+        player_hole (np.ndarray): (N, 2) encoded player hole cards.
+        bot_hole (np.ndarray): (N, 2) encoded bot hole cards.
+        board (np.ndarray): (N, 5) encoded community cards; only the
+            first `board_len` columns are dealt so far.
+        board_len (int): Number of community cards dealt (0, 3, 4 or 5).
+    """
+
+    def __init__(self, n_games, rng=None):
+        """
+        Deal hole cards for `n_games` fresh games.
+
+        Args:
+            n_games (int): Number of independent games in the batch.
+            rng (np.random.Generator, optional): Source of randomness;
+                a fresh default generator is used if omitted.
+        """
+        rng = rng or np.random.default_rng()
+        # One independent 52-card permutation per game; the first nine
+        # columns are the only cards a heads-up hand ever uses
+        order = rng.permuted(np.tile(np.arange(52), (n_games, 1)), axis=1)[:, :9]
+        cards = _ENCODED_DECK[order]
+        self.player_hole = cards[:, 0:2]
+        self.bot_hole = cards[:, 2:4]
+        self._undealt = cards[:, 4:9]
+        self.board = np.zeros((n_games, 5), dtype=np.int64)
+        self.board_len = 0
+
+    def deal(self, stage):
+        """Deal the named street for every game at once.
+
+        Args:
+            stage (str): "flop", "turn" or "river".
+        """
+        start, stop = _STAGE_SLICES[stage]
+        self.board[:, start:stop] = self._undealt[:, start:stop]
+        self.board_len = stop
+
+    def showdown(self):
+        """Score both seats' best 7-card hands for every game.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (N,) uint16 scores for the
+            player seat and the bot seat (smaller is stronger).
+
+        Raises:
+            ValueError: If the board is not fully dealt yet.
+        """
+        if self.board_len < 5:
+            raise ValueError("showdown requires a fully dealt board")
+        player = np.hstack((self.player_hole, self.board))
+        bot = np.hstack((self.bot_hole, self.board))
+        return eval7_batch(player), eval7_batch(bot)
@@ -19,6 +19,10 @@ BET_SIZES = {
 }
 MAX_RAISES_PER_ROUND = 4
 
+# Skip human-paced delays (e.g. the showdown pause) when a bot plays
+# both seats in a headless training run
+TRAINING_MODE = False
+
 SCREEN_WIDTH = 1700
 SCREEN_LENGTH = 900
 CARD_WIDTH = SCREEN_WIDTH / 18
@@ -29,6 +29,19 @@ class Controller:
         )
         self.view = view
 
+    def drain_events(self):
+        """
+        Process every pending pygame event in one pass.
+
+        Called once per betting-round iteration so the window stays
+        responsive (and quit still works) while the bot is acting,
+        instead of letting events queue up between player turns.
+        """
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
     def start_game(self):
         """
         Displays the start game button and waits for user interaction to start the game.
@@ -75,13 +88,19 @@ class Controller:
         """
 
         while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    for action, rect in self.view.action_buttons.items():
-                        if self.is_button_clicked(rect, event):
-                            return action
-            pygame.display.flip()
+            # Block in the OS until an event arrives (or one frame budget
+            # passes) instead of spinning a full core while the player
+            # thinks
+            event = pygame.event.wait(16)
+            if event.type == pygame.NOEVENT:
+                pygame.display.flip()
+                continue
+
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                action = self.view.hit_test(*event.pos)
+                if action is not None:
+                    return action
@@ -8,7 +8,10 @@ It uses a Monte Carlo simulation approach to estimate the equity of hands agains
 
 import random
 import json
-from hand_evaluator import eval7, DECK
+
+import numpy as np
+
+from hand_evaluator import eval7, eval7_batch, DECK, LOOKUP
 
 
 def to_card_name(rank, suit):
@@ -137,6 +140,54 @@ def simulate_equity(hand_str, num_trials=10000):
     return total_equity / len(hero_hands)
 
 
+def simulate_equity_batch(hand_str, num_trials=10000, rng=None):
+    """Vectorized Monte Carlo estimate of preflop equity for a hand type.
+
+    Same sampling scheme as simulate_equity, but every trial for a hero
+    combo is drawn and scored at once: the opponent and board cards come
+    from one batched permutation and both seats go through eval7_batch,
+    so no Python-level work happens per trial.
+
+    Args:
+        hand_str (str): Hand type string (e.g., 'AKs').
+        num_trials (int): Total number of simulations (default: 10000).
+        rng (np.random.Generator, optional): Source of randomness; a
+            fresh default generator is used if omitted.
+
+    Returns:
+        float: Estimated equity of the hand (between 0 and 1).
+    """
+    rng = rng or np.random.default_rng()
+    hero_hands = create_hand_from_string(hand_str)
+    total_equity = 0.0
+
+    for hero in hero_hands:
+        trials_per_combo = num_trials // len(hero_hands)
+        rest = np.array(
+            [LOOKUP[card] for card in DECK if card not in hero], dtype=np.int64
+        )
+        hero_enc = np.array([LOOKUP[card] for card in hero], dtype=np.int64)
+
+        # One 50-card permutation per trial; columns 0-1 are the
+        # opponent's hole cards and 2-6 the board
+        order = rng.permuted(
+            np.tile(np.arange(len(rest)), (trials_per_combo, 1)), axis=1
+        )[:, :7]
+        drawn = rest[order]
+        board = drawn[:, 2:7]
+
+        hero_scores = eval7_batch(
+            np.hstack((np.broadcast_to(hero_enc, (trials_per_combo, 2)), board))
+        )
+        opp_scores = eval7_batch(np.hstack((drawn[:, :2], board)))
+
+        wins = np.count_nonzero(hero_scores < opp_scores)
+        ties = np.count_nonzero(hero_scores == opp_scores)
+        total_equity += (wins + ties / 2) / trials_per_combo
+
+    return total_equity / len(hero_hands)
+
+
 def main():
     """Run simulations for all 169 hand types and save results to JSON."""
     hands = gen_all_starting_hands()
@@ -144,7 +195,7 @@ def main():
 
     for i, hand in enumerate(hands):
         print(f"[{i+1:3}/{len(hands)}] Simulating {hand}...")
-        equity = simulate_equity(hand, num_trials=5000)
+        equity = simulate_equity_batch(hand, num_trials=5000)
         table[hand] = round(equity, 4)
 
     with open("preflop_strength.json", "w", encoding="utf-8") as output_file:
@@ -2,6 +2,10 @@
 
 import itertools
 import random
+import sys
+
+import numpy as np
+
 from hand_evaluator_data import FLUSHES, UNIQUE_5, HASH_VALUES, HASH_ADJUST
 
 
@@ -30,9 +34,10 @@ RANK_NAMES = [
 ]
 SUIT_NAMES = ["spades", "clubs", "diamonds", "hearts"]
 
-# Full deck with human-readable strings
+# Full deck with human-readable strings, interned so every card name in
+# the process is one shared object and LOOKUP hits on identity
 DECK = [
-    f"{RANK_NAMES[rank]}_of_{SUIT_NAMES[suit]}"
+    sys.intern(f"{RANK_NAMES[rank]}_of_{SUIT_NAMES[suit]}")
     for rank, suit in itertools.product(range(13), range(4))
 ]
 
@@ -45,6 +50,12 @@ _DECK = [
 # Lookup table mapping string card name to encoded integer
 LOOKUP = dict(zip(DECK, _DECK))
 
+# Rank tables as int64 arrays, shared by the batched and compiled paths
+_FLUSHES_ARR = np.array(FLUSHES, dtype=np.int64)
+_UNIQUE_5_ARR = np.array(UNIQUE_5, dtype=np.int64)
+_HASH_ADJUST_ARR = np.array(HASH_ADJUST, dtype=np.int64)
+_HASH_VALUES_ARR = np.array(HASH_VALUES, dtype=np.int64)
+
 
 def hash_function(x_num: int) -> int:
     """Performs a custom hashing routine used for detecting hand types.
@@ -66,16 +77,15 @@ def hash_function(x_num: int) -> int:
     return HASH_VALUES[r_num]
 
 
-def eval5(hand: list[str]) -> int:
-    """Evaluates a 5-card poker hand and returns a numerical score (lower is better).
+def _eval5_encoded(card_1: int, card_2: int, card_3: int, card_4: int, card_5: int) -> int:
+    """Evaluates 5 already-encoded cards (Cactus Kev integers, lower is better).
 
     Args:
-        hand (list[str]): List of 5 string card names (e.g., "ace_of_spades").
+        card_1..card_5 (int): Bitmask-encoded card values from LOOKUP/_DECK.
 
     Returns:
         int: Hand strength value (smaller is stronger).
     """
-    card_1, card_2, card_3, card_4, card_5 = (LOOKUP[x_num] for x_num in hand)
     q_num = (card_1 | card_2 | card_3 | card_4 | card_5) >> 16
     # Check for flush using suit bits
     if 0xF000 & card_1 & card_2 & card_3 & card_4 & card_5:
@@ -95,28 +105,190 @@ def eval5(hand: list[str]) -> int:
     return hash_function(p_num)
 
 
+# Index patterns for choosing 5 cards out of 6 or 7, shared by the
+# pure-Python and compiled best-of evaluators
+_COMBOS_6 = tuple(itertools.combinations(range(6), 5))
+_COMBOS_7 = tuple(itertools.combinations(range(7), 5))
+
+
+def _best5(encoded: list[int], combos: tuple) -> int:
+    """Returns the best (lowest) 5-card score over the index combinations.
+
+    Args:
+        encoded (list[int]): Bitmask-encoded card values from LOOKUP/_DECK.
+        combos (tuple): 5-element index tuples selecting cards from `encoded`.
+
+    Returns:
+        int: Best 5-card hand strength among the selections.
+    """
+    return min(
+        _eval5_encoded(
+            encoded[i_1], encoded[i_2], encoded[i_3], encoded[i_4], encoded[i_5]
+        )
+        for i_1, i_2, i_3, i_4, i_5 in combos
+    )
+
+
+def _eval6_encoded(encoded: list[int]) -> int:
+    """Evaluates the best 5-card hand from 6 already-encoded cards."""
+    return _best5(encoded, _COMBOS_6)
+
+
+def _eval7_encoded(encoded: list[int]) -> int:
+    """Evaluates the best 5-card hand from 7 already-encoded cards."""
+    return _best5(encoded, _COMBOS_7)
+
+
+# Optional Numba acceleration: JIT-compile the 5-card core over plain
+# integers when numba is installed, otherwise keep the pure-Python path.
+# The 6- and 7-card evaluators also get compiled loops so a showdown is
+# one call into native code instead of 21 interpreter round trips.
+try:
+    from numba import njit as _njit
+
+    @_njit(cache=True)
+    def _eval5_jit(card_1, card_2, card_3, card_4, card_5):
+        """Compiled version of _eval5_encoded with hash_function inlined."""
+        q_num = (card_1 | card_2 | card_3 | card_4 | card_5) >> 16
+        if 0xF000 & card_1 & card_2 & card_3 & card_4 & card_5:
+            return _FLUSHES_ARR[q_num]
+        s_num = _UNIQUE_5_ARR[q_num]
+        if s_num:
+            return s_num
+        x_num = (
+            (card_1 & 0xFF)
+            * (card_2 & 0xFF)
+            * (card_3 & 0xFF)
+            * (card_4 & 0xFF)
+            * (card_5 & 0xFF)
+        )
+        x_num += 0xE91AAA35
+        x_num ^= x_num >> 16
+        x_num += x_num << 8
+        x_num &= 0xFFFFFFFF
+        x_num ^= x_num >> 4
+        b_num = (x_num >> 8) & 0x1FF
+        a_num = (x_num + (x_num << 2)) >> 19
+        r_num = (a_num ^ _HASH_ADJUST_ARR[b_num]) & 0x1FFF
+        return _HASH_VALUES_ARR[r_num]
+
+    _COMBOS_6_ARR = np.array(_COMBOS_6, dtype=np.int64)
+    _COMBOS_7_ARR = np.array(_COMBOS_7, dtype=np.int64)
+
+    @_njit(cache=True)
+    def _best5_jit(cards, combos):
+        """Compiled best-of loop over precomputed 5-card index rows."""
+        best = 0x7FFF
+        for i in range(combos.shape[0]):
+            row = combos[i]
+            score = _eval5_jit(
+                cards[row[0]],
+                cards[row[1]],
+                cards[row[2]],
+                cards[row[3]],
+                cards[row[4]],
+            )
+            if score < best:
+                best = score
+        return best
+
+    def _eval6_jit_wrapper(encoded):
+        return int(_best5_jit(np.fromiter(encoded, np.int64, 6), _COMBOS_6_ARR))
+
+    def _eval7_jit_wrapper(encoded):
+        return int(_best5_jit(np.fromiter(encoded, np.int64, 7), _COMBOS_7_ARR))
+
+    _eval5_encoded = _eval5_jit
+    _eval6_encoded = _eval6_jit_wrapper
+    _eval7_encoded = _eval7_jit_wrapper
+except ImportError:
+    pass
+
+
+def eval5(hand: list[str]) -> int:
+    """Evaluates a 5-card poker hand and returns a numerical score (lower is better).
+
+    Args:
+        hand (list[str]): List of 5 string card names (e.g., "ace_of_spades").
+
+    Returns:
+        int: Hand strength value (smaller is stronger).
+    """
+    return _eval5_encoded(*(LOOKUP[x_num] for x_num in hand))
+
+
 def eval6(hand: list[str]) -> int:
     """Evaluates the best 5-card hand out of 6 cards.
 
+    Cards are encoded to integers once, so the 6 five-card combinations
+    work on plain ints instead of repeating string lookups.
+
     Args:
         hand (list[str]): List of 6 string card names.
 
     Returns:
         int: Best 5-card hand strength among combinations.
     """
-    return min(eval5(combo) for combo in itertools.combinations(hand, 5))
+    return _eval6_encoded([LOOKUP[x_num] for x_num in hand])
 
 
 def eval7(hand: list[str]) -> int:
     """Evaluates the best 5-card hand out of 7 cards.
 
+    Cards are encoded to integers once, so the 21 five-card combinations
+    work on plain ints instead of repeating string lookups.
+
     Args:
         hand (list[str]): List of 7 string card names.
 
     Returns:
         int: Best 5-card hand strength among combinations.
     """
-    return min(eval5(combo) for combo in itertools.combinations(hand, 5))
+    return _eval7_encoded([LOOKUP[x_num] for x_num in hand])
+
+
+def eval7_batch(hands) -> np.ndarray:
+    """Evaluates many 7-card hands at once with vectorized table lookups.
+
+    Runs the same flush / unique / prime-hash logic as _eval5_encoded
+    over all 21 five-card selections of every hand simultaneously, so
+    Monte-Carlo equity rollouts can score large batches without a
+    Python-level call per hand.
+
+    Args:
+        hands: An (N, 7) integer array of already-encoded cards, or an
+            iterable of 7-card lists of string card names.
+
+    Returns:
+        np.ndarray: (N,) uint16 hand strengths (smaller is stronger).
+    """
+    if isinstance(hands, np.ndarray):
+        encoded = hands.astype(np.int64, copy=False)
+    else:
+        encoded = np.array(
+            [[LOOKUP[card] for card in hand] for hand in hands], dtype=np.int64
+        )
+    best = np.full(encoded.shape[0], 0x7FFF, dtype=np.int64)
+    for combo in _COMBOS_7:
+        cards = encoded[:, combo]
+        q_num = np.bitwise_or.reduce(cards, axis=1) >> 16
+        # Unique (no-pair, non-flush) patterns come straight from the table
+        scores = _UNIQUE_5_ARR[q_num].copy()
+        flush = (np.bitwise_and.reduce(cards, axis=1) & 0xF000) != 0
+        scores[flush] = _FLUSHES_ARR[q_num[flush]]
+        # Everything else goes through the prime-product hash
+        hashed = ~flush & (scores == 0)
+        if hashed.any():
+            x_num = np.prod(cards[hashed] & 0xFF, axis=1) + 0xE91AAA35
+            x_num ^= x_num >> 16
+            x_num = (x_num + (x_num << 8)) & 0xFFFFFFFF
+            x_num ^= x_num >> 4
+            b_num = (x_num >> 8) & 0x1FF
+            a_num = (x_num + (x_num << 2)) >> 19
+            r_num = (a_num ^ _HASH_ADJUST_ARR[b_num]) & 0x1FFF
+            scores[hashed] = _HASH_VALUES_ARR[r_num]
+        np.minimum(best, scores, out=best)
+    return best.astype(np.uint16)
 
 
 def one_round5() -> None:
@@ -6,9 +6,11 @@ import pygame
 
 from model import Model
 from view import PokerView
+from ML_bot import QBot
 
 
-model = Model()  # Initialize the model
+bot = QBot(num_buckets=20, save_path="q_strategy.json")  # Load strategy once
+model = Model(bot=bot)  # Initialize the model with the shared bot
 view = PokerView(model)  # Initialize the view with the model
 clock = pygame.time.Clock()
 
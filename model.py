@@ -1,7 +1,9 @@
 """Contains the Model class for the poker game."""
 
+import sys
 from time import sleep
-import random
+
+import numpy as np
 
 from ML_bot import bot_action, QBot
 from hand_evaluator import eval7
@@ -14,10 +16,33 @@ from config import (
     BIG_BLIND,
     BET_SIZES,
     MAX_RAISES_PER_ROUND,
+    TRAINING_MODE,
 )
 from config import player_blind_pos, bot_blind_pos
 
 
+_SUITS = ["spades", "clubs", "diamonds", "hearts"]
+_RANKS = [
+    "2",
+    "3",
+    "4",
+    "5",
+    "6",
+    "7",
+    "8",
+    "9",
+    "10",
+    "jack",
+    "queen",
+    "king",
+    "ace",
+]
+# Built once at import; each hand just copies this tuple. Interning the
+# names makes every dealt card the same object the evaluator's LOOKUP
+# table was keyed with, so its dict hits short-circuit on identity.
+DECK = tuple(sys.intern(f"{rank}_of_{suit}") for suit in _SUITS for rank in _RANKS)
+
+
 class Model:
     """
     Model class for the poker game. It handles the game logic, including
@@ -28,12 +53,19 @@ class Model:
         chips (dict): Dictionary mapping player names to their chip counts.
     """
 
-    def __init__(self):
+    def __init__(self, bot=None, player_input=None):
         """
         Initializes the Model with player names, starting stacks, blinds,
         and other game parameters.
 
         Args:
+            bot (QBot, optional): Shared bot instance to reuse across models.
+                A new QBot is created (loading its strategy file) if omitted.
+            player_input (callable, optional): Called with this model to get
+                the player's action ("fold"/"check"/"call"/"raise") instead of
+                waiting on the pygame controller. Lets a training harness
+                drive the player seat with a bot so no betting round blocks
+                on UI input.
             _players (list): List of player names.
             _chips (dict): Dictionary mapping player names to their chip counts.
             _small_blind (int): Amount for the small blind.
@@ -63,6 +95,7 @@ class Model:
         self._small_blind = SMALL_BLIND
         self._big_blind = BIG_BLIND
         self._deck = self.create_deck()
+        self._rng = np.random.default_rng()
         self.player_hand = []
         self.bot_hand = []
         self.community_cards = []
@@ -88,12 +121,11 @@ class Model:
         self.stage = ""
         self.previous_player_chips = 0
         self.previous_bot_chips = self._chips[self._players[1]]
-        self.controller = Controller(self.view)
         self.raise_count = 0  # Track number of raises in current round
         self._max_raises_per_round = MAX_RAISES_PER_ROUND  # Make accessible to bot
-        self.bot = QBot(
-            num_buckets=20, save_path="q_strategy.json"
-        )  # Initialize the bot
+        # Reuse an injected bot so its strategy file is only loaded once
+        self.bot = bot or QBot(num_buckets=20, save_path="q_strategy.json")
+        self._player_input = player_input
         self.game_history = []  # For tracking results
         self.controller = Controller(self.view)  # Initialize the controller
 
@@ -111,31 +143,37 @@ class Model:
         """Create a deck of cards
 
         Returns:
-            list: A list of strings representing the deck of cards.
+            list: A list of strings representing the deck of cards,
+            copied from the precomputed module-level DECK constant.
         """
-        suits = ["spades", "clubs", "diamonds", "hearts"]
-        ranks = [
-            "2",
-            "3",
-            "4",
-            "5",
-            "6",
-            "7",
-            "8",
-            "9",
-            "10",
-            "jack",
-            "queen",
-            "king",
-            "ace",
-        ]
-        return [f"{rank}_of_{suit}" for suit in suits for rank in ranks]
+        return list(DECK)
 
     def deal_hands(self):
-        """Deal two cards to each player"""
-        random.shuffle(self._deck)
-        self.player_hand = [self._deck.pop(), self._deck.pop()]
-        self.bot_hand = [self._deck.pop(), self._deck.pop()]
+        """Deal two cards to each player
+
+        Draws just the four hole cards with the NumPy generator instead
+        of shuffling all 52 cards first.
+        """
+        cards = self._draw_cards(4)
+        self.player_hand = cards[:2]
+        self.bot_hand = cards[2:4]
+
+    def _draw_cards(self, count):
+        """Remove and return `count` uniformly random cards from the deck.
+
+        One RNG call covers the whole draw instead of one per card.
+        """
+        deck = self._deck
+        ids = self._rng.choice(len(deck), count, replace=False)
+        cards = [deck[i] for i in ids]
+        # Delete from the highest index down so positions stay valid
+        for idx in sorted(ids.tolist(), reverse=True):
+            del deck[idx]
+        return cards
+
+    def _draw_card(self):
+        """Remove and return a uniformly random card from the deck."""
+        return self._deck.pop(int(self._rng.integers(len(self._deck))))
 
     def deal_community_cards(self, stage):
         """Deals the appropriate community cards based on the stage.
@@ -143,59 +181,90 @@ class Model:
             stage (str): The current stage of the game (flop, turn, river).
         """
         if stage == "flop":
-            self.community_cards = [self._deck.pop() for _ in range(3)]
+            self.community_cards = self._draw_cards(3)
         elif stage in ["turn", "river"]:
-            self.community_cards.append(self._deck.pop())
+            self.community_cards.append(self._draw_card())
 
     def player_bet_handling(self):
-        """Handle player betting by deducting chips"""
-        self._chips[self._players[0]] -= self.player_bet - self.previous_player_bet
+        """Handle player betting by deducting chips and growing the pot"""
+        delta = self.player_bet - self.previous_player_bet
+        self._chips[self._players[0]] -= delta
+        self.pot += delta
         self.previous_player_bet = self.player_bet
 
     def bot_bet_handling(self):
-        """Handle bot betting by deducting chips"""
-        self._chips[self._players[1]] -= self.bot_bet - self.previous_bot_bet
+        """Handle bot betting by deducting chips and growing the pot"""
+        delta = self.bot_bet - self.previous_bot_bet
+        self._chips[self._players[1]] -= delta
+        self.pot += delta
         self.previous_bot_bet = self.bot_bet
 
     def get_current_bet_size(self):
         """Return the current fixed bet size for the stage"""
         return BET_SIZES.get(self.stage, BIG_BLIND)
 
+    def _handle_fold(self):
+        """Player folds; the hand ends with a bot win."""
+        return "Bot"
+
+    def _handle_check(self):
+        """Player checks, staying in the pot; invalid if a call is owed."""
+        if self.player_bet < self.bot_bet:
+            return None
+        self.view.hide_invalid_text()
+        return 0
+
+    def _handle_call(self):
+        """Player matches the current bet."""
+        self.player_bet = self.current_bet
+        self.player_bet_handling()
+        self.view.hide_invalid_text()
+        return "continue"
+
+    def _handle_raise(self):
+        """Player raises by the stage bet size; invalid past the raise cap."""
+        if self.raise_count >= MAX_RAISES_PER_ROUND:
+            return None
+        bet_size = self.get_current_bet_size()
+        self.player_bet = self.current_bet + bet_size
+        self.current_bet = self.player_bet
+        self.player_bet_handling()
+        self.raise_count += 1
+        self.view.hide_invalid_text()
+        return "continue"
+
+    # Hash dispatch instead of an if/elif chain of string compares;
+    # handlers return None when the action is invalid right now
+    _ACTION_HANDLERS = {
+        "fold": _handle_fold,
+        "check": _handle_check,
+        "call": _handle_call,
+        "raise": _handle_raise,
+    }
+
     def player_action_model(self):
         """Player's action during the betting round (e.g., fold, check, bet, etc.)
+
+        Loops until a valid action is chosen rather than recursing, so
+        repeated invalid inputs cannot grow the call stack. Actions
+        dispatch through _ACTION_HANDLERS.
+
         Returns:
             str: Defines how the game continues (continue/winner name).
         """
-        action = self.controller.player_action_controller()
+        handlers = self._ACTION_HANDLERS
+        while True:
+            if self._player_input is not None:
+                action = self._player_input(self)
+            else:
+                action = self.controller.player_action_controller()
 
-        if action == "fold":
-            return "Bot"  # Player folds, end hand with Bot Win
-        if action == "check":
-            if self.player_bet < self.bot_bet:
+            handler = handlers.get(action)
+            result = handler(self) if handler is not None else None
+            if result is None:
                 self.view.display_invalid_text()
-                return self.player_action_model()
-            self.view.hide_invalid_text()
-            return 0  # Player checks, stays in the pot
-        if action == "call":
-            self.player_bet = self.current_bet
-            self.player_bet_handling()
-            self.view.hide_invalid_text()
-            return "continue"  # Player calls
-        if action == "raise":
-            if self.raise_count >= MAX_RAISES_PER_ROUND:
-                self.view.display_invalid_text()
-                return self.player_action_model()
-
-            bet_size = self.get_current_bet_size()
-            self.player_bet = self.current_bet + bet_size
-            self.current_bet = self.player_bet
-            self.player_bet_handling()
-            self.raise_count += 1
-            self.view.hide_invalid_text()
-            return "continue"
-
-        self.view.display_invalid_text()
-        return self.player_action_model()
+                continue
+            return result
 
     def betting_round(self):
         """Handle a betting round with limit betting structure
@@ -207,66 +276,89 @@ class Model:
             str: The result of the betting round (e.g., "Player", "Bot", or "continue").
         """
         act_first = self.small_blind_holder
+        # Hoist the per-iteration attribute and dict lookups once
+        player, bot = self._players
+        chips = self._chips
+        view = self.view
 
         # Reset raise count for new betting round
         self.raise_count = 0
 
+        # Handle any events queued while no input was being read
+        self.controller.drain_events()
+
         if act_first == PLAYER_NAME:
             result = self.player_action_model()
-            if result in [PLAYER_NAME, "Bot"]:
+            if result in (PLAYER_NAME, "Bot"):
                 return result
             result = bot_action(self)
-            # Update bot bet display after bot acts
-            self.view.display_bot_stack(self._chips[self._players[1]])
-            self.view.display_bot_round_bet(
-                self.previous_player_chips - self._chips[self._players[0]]
+            # Update bot bet display after bot acts, in one present
+            view.begin_frame()
+            view.display_bot_stack(chips[bot])
+            view.display_bot_round_bet(
+                self.previous_player_chips - chips[player]
             )
-            if result in [PLAYER_NAME, "Bot"]:
+            view.end_frame()
+            if result in (PLAYER_NAME, "Bot"):
                 return result
         else:
             result = bot_action(self)
             # Update bot bet display immediately after bot acts
-            bot_round_bet = self.previous_bot_chips - self._chips[self._players[1]]
-            self.view.display_bot_stack(self._chips[self._players[1]])
-            self.view.display_bot_round_bet(bot_round_bet)
-            if result in [PLAYER_NAME, "Bot"]:
+            bot_round_bet = self.previous_bot_chips - chips[bot]
+            view.begin_frame()
+            view.display_bot_stack(chips[bot])
+            view.display_bot_round_bet(bot_round_bet)
+            view.end_frame()
+            if result in (PLAYER_NAME, "Bot"):
                 return result
             result = self.player_action_model()
-            if result in [PLAYER_NAME, "Bot"]:
+            if result in (PLAYER_NAME, "Bot"):
                 return result
 
         while self.player_bet != self.bot_bet:
-            # Update displayed bets
-            player_round_bet = (
-                self.previous_player_chips - self._chips[self._players[0]]
-            )
-            bot_round_bet = self.previous_bot_chips - self._chips[self._players[1]]
-            self.view.display_player_round_bet(player_round_bet)
-            self.view.display_bot_round_bet(bot_round_bet)
+            self.controller.drain_events()
+            # Update displayed bets with a single present per decision
+            player_round_bet = self.previous_player_chips - chips[player]
+            bot_round_bet = self.previous_bot_chips - chips[bot]
+            view.begin_frame()
+            view.display_player_round_bet(player_round_bet)
+            view.display_bot_round_bet(bot_round_bet)
 
             self.get_round_bets()
-            self.view.display_pot(self.pot)
+            view.display_pot(self.pot)
 
             if self.player_bet < self.bot_bet:
-                self.view.display_bot_stack(self._chips[self._players[1]])
-                self.view.display_player_stack(self._chips[self._players[0]])
+                view.display_bot_stack(chips[bot])
+                view.display_player_stack(chips[player])
+                view.end_frame()
                 result = self.player_action_model()
                 if result == "Bot":  # Player folded
                     return result
             else:
+                view.end_frame()
                 result = bot_action(self)
                 # Update bot display after action
-                bot_round_bet = self.previous_bot_chips - self._chips[self._players[1]]
-                self.view.display_bot_stack(self._chips[self._players[1]])
-                self.view.display_bot_round_bet(bot_round_bet)
+                bot_round_bet = self.previous_bot_chips - chips[bot]
+                view.begin_frame()
+                view.display_bot_stack(chips[bot])
+                view.display_bot_round_bet(bot_round_bet)
+                view.end_frame()
                 if result == PLAYER_NAME:  # Bot folded
                     return result
 
     def run(self):
         """Main game loop for running the poker game"""
 
-        # Initialize game state
-        self.controller.start_game()
+        # One bounded stack frame per hand instead of tail-recursing;
+        # the start-button wait stays inside the loop so each hand's
+        # result remains on screen until the player starts the next one
+        while True:
+            self.controller.start_game()
+            self._play_one_hand()
+
+    def _play_one_hand(self):
+        """Play a single hand from deal through pot distribution"""
+
         # Reset game state for a new hand
         self.reset_after_hand()
         self.deal_hands()
@@ -286,108 +378,84 @@ class Model:
         self.view.display_round(self.stage)
         result = self.betting_round()
         self.get_round_bets()
+        self.view.begin_frame()
         self.view.display_player_stack(self._chips[self._players[0]])
         self.view.display_bot_stack(self._chips[self._players[1]])
+        self.view.end_frame()
 
         # Handle result if someone folded
-        if result in [PLAYER_NAME, "Bot"]:
+        if result in (PLAYER_NAME, "Bot"):
             self.view.display_winner(result)
-
-            # Calculate reward for the bot's learning
-            reward = 1.0 if result == "Bot" else -1.0
-            reward *= self.pot
-            self.bot.update(reward)
-
-            # Distribute pot
-            if result == PLAYER_NAME:
-                self._chips[self._players[0]] += self.pot
-            else:
-                self._chips[self._players[1]] += self.pot
-
+            self._award_pot(result)
             self.pot = 0
-            self.run()
+            return
 
-        for stage in ["flop", "turn", "river"]:
+        for stage in ("flop", "turn", "river"):
             self.stage = stage
-            self.view.display_round(self.stage)
             self.reset_after_betting_round()
-            self.view.display_pot(self.pot)
             self.deal_community_cards(self.stage)
 
-            # Display community cards
+            # Present the round label, pot and new community cards as
+            # one update instead of one flip each
+            self.view.begin_frame()
+            self.view.display_round(self.stage)
+            self.view.display_pot(self.pot)
             if stage == "flop":
                 self.view.display_flop(self.community_cards[0:3])
             elif stage == "turn":
                 self.view.display_turn(self.community_cards[3:4])
             elif stage == "river":
                 self.view.display_river(self.community_cards[4:5])
+            self.view.end_frame()
 
             result = self.betting_round()
+            self.view.begin_frame()
             self.view.display_player_stack(self._chips[self._players[0]])
             self.view.display_bot_stack(self._chips[self._players[1]])
+            self.view.end_frame()
             self.get_round_bets()
 
             # Handle result if someone folded
-            if result in [PLAYER_NAME, "Bot"]:
-                self.pot = (
-                    self.previous_stack
-                    - self._chips[self._players[0]]
-                    - self._chips[self._players[1]]
-                )
+            if result in (PLAYER_NAME, "Bot"):
                 self.view.display_winner(result)
-
-                # Calculate reward for the bot's learning
-                if result == "Bot":
-                    reward = 1.0  # Bot wins
-                else:
-                    reward = -1.0  # Player wins
-
-                # Scale reward by pot size
-                reward *= self.pot
-
-                # Update bot strategy with the scaled reward
-                self.bot.update(reward)
-
-                # Distribute pot
-                if result == PLAYER_NAME:
-                    self._chips[self._players[0]] += self.pot
-                else:
-                    self._chips[self._players[1]] += self.pot
-
-                self.run()
+                self._award_pot(result)
+                return
 
         # Showdown (winner determination)
+        self.view.begin_frame()
         self.view.display_showdown()
         self.view.display_bot_hand(self.bot_hand)
-        sleep(3)
+        self.view.end_frame()
+        # The pause exists for the human to read the bot's hand; it would
+        # cap training at a fraction of a hand per second
+        if not TRAINING_MODE:
+            sleep(3)
         player_hand_rank = self.hand_evaluator(self.player_hand + self.community_cards)
         bot_hand_rank = self.hand_evaluator(self.bot_hand + self.community_cards)
 
-        self.pot = (
-            self.previous_stack
-            - self._chips[self._players[0]]
-            - self._chips[self._players[1]]
-        )
         self.view.display_pot(self.pot)
 
         # Determine winner and update bot's strategy
         if player_hand_rank < bot_hand_rank:  # Lower rank is better in the evaluator
             self.view.display_winner(PLAYER_NAME)
-            self._chips[self._players[0]] += self.pot
-            reward = -1 * self.pot  # Negative reward for losing
-            self.bot.update(reward)
-            self.run()
+            self._award_pot(PLAYER_NAME)
         elif player_hand_rank == bot_hand_rank:
             self._chips[self._players[0]] += self.pot // 2
             self._chips[self._players[1]] += self.pot // 2
             self.bot.update(0.0)  # Neutral reward for tie
-            self.run()
         else:
             self.view.display_winner("Bot")
-            self._chips[self._players[1]] += self.pot
-            reward = 1 * self.pot  # Positive reward for winning
-            self.bot.update(reward)
-            self.run()
+            self._award_pot("Bot")
+
+    def _award_pot(self, winner):
+        """Pay the pot to the winner and feed the bot its scaled reward.
+
+        Args:
+            winner (str): PLAYER_NAME or "Bot"; both are chip-stack keys.
+        """
+        reward = self.pot if winner == "Bot" else -self.pot
+        self.bot.update(reward)
+        self._chips[winner] += self.pot
 
     def hand_evaluator(self, cards):
         """Evaluate the best hand from the player's and community cards
@@ -401,21 +469,17 @@ class Model:
 
     def reset_after_betting_round(self):
         """Reset betting values after a betting round"""
+        # Everything is zero after a completed round; no need to derive
+        # the values from each other
         self.player_bet = 0
         self.bot_bet = 0
-        self.previous_player_bet = self.player_bet
-        self.previous_bot_bet = self.bot_bet
-        self.current_bet = max(self.player_bet, self.bot_bet)
-        self.pot = (
-            self.previous_stack
-            - self._chips[self._players[0]]
-            - self._chips[self._players[1]]
-        )
+        self.previous_player_bet = 0
+        self.previous_bot_bet = 0
+        self.current_bet = 0
         self.raise_count = 0  # Reset raise count for new betting round
 
     def reset_after_hand(self):
         """Reset Many Values after hand ends"""
-        self._deck = []
         self._deck = self.create_deck()
 
         # Switch blinds
@@ -451,12 +515,9 @@ class Model:
         self._chips[self._players[1]] -= self.bot_bet
 
         # Put blinds into the pot
-        self.pot = (
-            self.previous_stack
-            - self._chips[self._players[0]]
-            - self._chips[self._players[1]]
-        )
-        self.current_bet = max(self.player_bet, self.bot_bet)
+        self.pot = self.player_bet + self.bot_bet
+        # One bet is always the big blind, the other the small blind
+        self.current_bet = BIG_BLIND
         self.raise_count = 0  # Reset raise count for new hand
         self.community_cards = []  # Clear community cards
 
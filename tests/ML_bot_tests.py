@@ -57,7 +57,7 @@ def community_cards():
 
 
 @pytest.fixture
-def mock_game_state():
+def mock_game_state(tmp_path):
     """Mock game state for testing bot_action and related functions"""
     game = MagicMock()
     game.stage = "preflop"
@@ -76,7 +76,9 @@ def mock_game_state():
     game.get_current_bet_size = MagicMock(return_value=20)
 
     # Create a real QBot instance for the game
-    game.bot = QBot(num_buckets=10, save_path="test_q_strategy.json")
+    # tmp_path keeps the strategy file (including the atexit flush at
+    # interpreter exit) out of the repo root
+    game.bot = QBot(num_buckets=10, save_path=str(tmp_path / "test_q_strategy.json"))
 
     return game
 
@@ -182,49 +184,54 @@ def test_bot_bet_handling():
 # Tests for QBot class
 
 
-def test_qbot_initialization():
+def test_qbot_initialization(tmp_path):
     # Test default initialization
-    qbot = QBot(num_buckets=20, save_path="test_q_strategy.json")
+    qbot = QBot(num_buckets=20, save_path=str(tmp_path / "test_q_strategy.json"))
     assert qbot.num_buckets == 20
     assert qbot.num_states == 4 * 20 * 4
     assert qbot.Q.shape == (4 * 20 * 4, 3)
     assert len(qbot.trajectory) == 0
 
     # Test with different parameters
-    qbot2 = QBot(num_buckets=10, save_path="different_path.json")
+    qbot2 = QBot(num_buckets=10, save_path=str(tmp_path / "different_path.json"))
     assert qbot2.num_buckets == 10
     assert qbot2.num_states == 4 * 10 * 4
     assert qbot2.Q.shape == (4 * 10 * 4, 3)
 
 
-def test_qbot_load_strategy():
+def test_qbot_load_strategy(tmp_path):
     # Test loading with existing file
     q_data = {"q_table": [[[0.1, 0.2, 0.3]] * (4 * 10 * 4)], "games_played": 42}
 
     with patch("os.path.exists", return_value=True):
         with patch("builtins.open", mock_open(read_data=json.dumps(q_data))):
-            qbot = QBot(num_buckets=10, save_path="test_q_strategy.json")
+            qbot = QBot(
+                num_buckets=10, save_path=str(tmp_path / "test_q_strategy.json")
+            )
             assert qbot.games_played == 42
 
     # Test loading with error
     with patch("os.path.exists", return_value=True):
         with patch("builtins.open", side_effect=Exception("Test error")):
             with patch("sys.stdout", new=StringIO()):  # Capture print output
-                qbot = QBot(num_buckets=10, save_path="test_q_strategy.json")
+                qbot = QBot(
+                    num_buckets=10, save_path=str(tmp_path / "error_q_strategy.json")
+                )
                 # Should initialize with random values
                 assert qbot.Q.shape == (4 * 10 * 4, 3)
                 # At least some values should be non-zero
                 assert np.any(qbot.Q != 0)
 
 
-def test_qbot_save_strategy():
-    qbot = QBot(num_buckets=5, save_path="test_q_strategy.json")
+def test_qbot_save_strategy(tmp_path):
+    save_path = str(tmp_path / "test_q_strategy.json")
+    qbot = QBot(num_buckets=5, save_path=save_path)
 
     # Test successful save
     with patch("builtins.open", mock_open()) as mock_file:
         with patch("json.dump") as mock_json_dump:
             qbot.save_strategy()
-            mock_file.assert_called_once_with("test_q_strategy.json", "w")
+            mock_file.assert_called_once_with(save_path, "w")
             mock_json_dump.assert_called_once()
 
     # Test save with error
@@ -235,8 +242,8 @@ def test_qbot_save_strategy():
             assert "Error saving strategy" in output
 
 
-def test_qbot_encode_state():
-    qbot = QBot(num_buckets=10)
+def test_qbot_encode_state(tmp_path):
+    qbot = QBot(num_buckets=10, save_path=str(tmp_path / "q_strategy.json"))
 
     # Test various state encodings
     state1 = qbot.encode_state(0, 0, 0)  # Preflop, lowest rank, no bets
@@ -251,8 +258,8 @@ def test_qbot_encode_state():
     assert state3 == 3 * 10 * 4 + 9 * 4 + 3
 
 
-def test_qbot_get_bucket():
-    qbot = QBot(num_buckets=10)
+def test_qbot_get_bucket(tmp_path):
+    qbot = QBot(num_buckets=10, save_path=str(tmp_path / "q_strategy.json"))
 
     # Test bucket calculation
     assert qbot.get_bucket(0) == 0  # Best possible hand
@@ -263,28 +270,28 @@ def test_qbot_get_bucket():
     assert qbot.get_bucket(7462) == 9  # Should cap at num_buckets - 1
 
 
-def test_qbot_get_valid_actions():
-    qbot = QBot()
+def test_qbot_get_valid_actions(tmp_path):
+    qbot = QBot(save_path=str(tmp_path / "q_strategy.json"))
 
     # Test different betting states
-    assert qbot.get_valid_actions(0) == [1, 2]  # No bets yet: Check or Raise
+    assert qbot.get_valid_actions(0) == (1, 2)  # No bets yet: Check or Raise
     # Bot bet, player hasn't: Check or Raise
-    assert qbot.get_valid_actions(1) == [1, 2]
+    assert qbot.get_valid_actions(1) == (1, 2)
     # Both bet same: Check/Call only
-    assert qbot.get_valid_actions(2) == [1]
+    assert qbot.get_valid_actions(2) == (1,)
     # Player bet, bot didn't: Fold, Call, or Raise
-    assert qbot.get_valid_actions(3) == [0, 1, 2]
+    assert qbot.get_valid_actions(3) == (0, 1, 2)
 
     # Test with raise cap reached
-    assert qbot.get_valid_actions(3, raise_cap_reached=True) == [
+    assert qbot.get_valid_actions(3, raise_cap_reached=True) == (
         0,
         1,
-    ]  # Can't raise anymore
+    )  # Can't raise anymore
 
 
-def test_qbot_record_and_update():
+def test_qbot_record_and_update(tmp_path):
     with patch("ML_bot.QBot.load_strategy"):  # Mock to skip actual loading
-        qbot = QBot(num_buckets=5)
+        qbot = QBot(num_buckets=5, save_path=str(tmp_path / "q_strategy.json"))
 
     original_q = qbot.Q.copy()
 
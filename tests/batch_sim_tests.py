@@ -0,0 +1,60 @@
+"""
+Unit tests for the batched struct-of-arrays dealing module.
+"""
+
+import numpy as np
+import pytest
+
+from batch_sim import BatchedDeals, _ENCODED_DECK
+from hand_evaluator import DECK, LOOKUP, eval7
+
+# Reverse mapping from encoded int back to the card name
+_DECODE = {LOOKUP[card]: card for card in DECK}
+
+
+def test_deal_covers_unique_cards_per_game():
+    deals = BatchedDeals(20, rng=np.random.default_rng(0))
+    for stage in ("flop", "turn", "river"):
+        deals.deal(stage)
+
+    used = np.hstack((deals.player_hole, deals.bot_hole, deals.board))
+    assert used.shape == (20, 9)
+    for row in used:
+        # No game may deal the same card twice
+        assert len(set(row.tolist())) == 9
+        # Every card must be a real encoded deck card
+        assert all(card in _DECODE for card in row.tolist())
+
+
+def test_board_grows_by_stage():
+    deals = BatchedDeals(4, rng=np.random.default_rng(1))
+    assert deals.board_len == 0
+    deals.deal("flop")
+    assert deals.board_len == 3
+    deals.deal("turn")
+    assert deals.board_len == 4
+    deals.deal("river")
+    assert deals.board_len == 5
+
+
+def test_showdown_matches_eval7():
+    deals = BatchedDeals(10, rng=np.random.default_rng(2))
+    for stage in ("flop", "turn", "river"):
+        deals.deal(stage)
+
+    player_scores, bot_scores = deals.showdown()
+
+    for i in range(10):
+        player_cards = [
+            _DECODE[c] for c in (*deals.player_hole[i], *deals.board[i])
+        ]
+        bot_cards = [_DECODE[c] for c in (*deals.bot_hole[i], *deals.board[i])]
+        assert int(player_scores[i]) == eval7(player_cards)
+        assert int(bot_scores[i]) == eval7(bot_cards)
+
+
+def test_showdown_requires_full_board():
+    deals = BatchedDeals(2, rng=np.random.default_rng(3))
+    deals.deal("flop")
+    with pytest.raises(ValueError):
+        deals.showdown()
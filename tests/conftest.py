@@ -0,0 +1,19 @@
+"""
+Shared test environment: repo root on sys.path and headless SDL, set up
+exactly once per pytest process instead of per file.
+
+The sys.modules stubs themselves stay file-local on purpose — the stub
+sets conflict between files (model_tests fakes hand_evaluator and view,
+while hand_eval_tests and view_tests need the real ones), so each test
+file is run in its own process and installs only the stubs its target
+module needs.
+"""
+
+import os
+import sys
+
+# Make the project modules importable without requiring PYTHONPATH=.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Headless pygame for every test process
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
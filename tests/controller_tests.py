@@ -17,9 +17,6 @@ import pytest
 # ────────────────────────────────────────────────────────────────────────────
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
-pygame.init()  # pylint: disable=no-member
-pygame.display.set_mode((1, 1))
-
 # ────────────────────────────────────────────────────────────────────────────
 # 2.  Minimal **config** with just what controller needs
 # ────────────────────────────────────────────────────────────────────────────
@@ -51,6 +48,15 @@ class DummyView:
         """
         self.started = True
 
+    def hit_test(self, x, y):
+        """
+        Mirror PokerView.hit_test over the stub's action buttons.
+        """
+        for action, rect in self.action_buttons.items():
+            if rect.collidepoint((x, y)):
+                return action
+        return None
+
 
 # ────────────────────────────────────────────────────────────────────────────
 # 4.  Import the real Controller (after stubs are ready)
@@ -60,11 +66,22 @@ Controller = controller.Controller
 
 
 # ────────────────────────────────────────────────────────────────────────────
-# 5.  Fixture: silence pygame.display.flip so loops don’t actually flip
+# 5.  Fixtures: one headless pygame bring-up per session, with flip
+#     silenced for the whole run; events still cleared per test
 # ────────────────────────────────────────────────────────────────────────────
+@pytest.fixture(scope="session", autouse=True)
+def _pygame_session():
+    pygame.init()  # pylint: disable=no-member
+    pygame.display.set_mode((1, 1))
+    original_flip = pygame.display.flip
+    pygame.display.flip = lambda: None
+    yield
+    pygame.display.flip = original_flip
+    pygame.quit()  # pylint: disable=no-member
+
+
 @pytest.fixture(autouse=True)
-def stub_flip(monkeypatch):
-    monkeypatch.setattr(pygame.display, "flip", lambda: None)
+def _clear_events():
     yield
     pygame.event.clear()
 
@@ -74,21 +91,15 @@ def stub_flip(monkeypatch):
 # ────────────────────────────────────────────────────────────────────────────
 @contextmanager
 def event_stream(events):
-    """Temporarily monkey‑patch pygame.event.get to yield *events*, then []."""
-    original_get = pygame.event.get
-    called = {"n": 0}
-
-    def fake_get():
-        called["n"] += 1
-        if called["n"] == 1:
-            return events
-        return []
-
-    pygame.event.get = fake_get
+    """Post scripted events to the real pygame queue so the C-level
+    event.get/event.wait serve them with no Python shims in the loop."""
+    pygame.event.clear()
+    for event in events:
+        pygame.event.post(event)
     try:
         yield
     finally:
-        pygame.event.get = original_get
+        pygame.event.clear()
 
 
 # ────────────────────────────────────────────────────────────────────────────
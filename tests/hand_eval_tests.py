@@ -6,8 +6,8 @@ including the evaluation of 5-card, 6-card, and 7-card hands.
 
 import pytest
 import random
-from unittest.mock import patch
-from io import StringIO
+
+import numpy as np
 
 # Import the module to test
 from hand_evaluator import (
@@ -23,6 +23,7 @@ from hand_evaluator import (
     eval5,
     eval6,
     eval7,
+    eval7_batch,
     one_round5,
     one_round7,
     HASH_ADJUST,
@@ -34,7 +35,7 @@ from hand_evaluator import (
 # Test fixture for common hand types
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_hands():
     return {
         # Royal flush
@@ -120,6 +121,12 @@ def sample_hands():
     }
 
 
+@pytest.fixture(scope="session")
+def sample_scores(sample_hands):
+    # eval5 is pure, so score each sample hand once for the whole session
+    return {hand_type: eval5(cards) for hand_type, cards in sample_hands.items()}
+
+
 # Test basic constants and card representation
 
 
@@ -152,54 +159,49 @@ def test_deck_constants():
     assert len(set(_DECK)) == 52
 
 
+# Encode the whole deck once at import so the mapping test only does
+# whole-array bit checks
+_ENCODED_DECK = np.array([LOOKUP[card] for card in DECK], dtype=np.int32)
+
+
 def test_lookup_mapping():
     # Test that lookup mapping works correctly for a few cards
     assert "ace_of_spades" in LOOKUP
     assert "king_of_hearts" in LOOKUP
     assert "2_of_clubs" in LOOKUP
 
-    # Test that the encoding format is consistent
-    for card_name in DECK:
-        rank_name, suit_name = card_name.split("_of_")
-        rank_index = RANK_NAMES.index(rank_name)
-        suit_index = SUIT_NAMES.index(suit_name)
-
-        # Verify the card encoding contains the right components
-        encoded_card = LOOKUP[card_name]
-        assert encoded_card & 0xF000  # Has suit bits
-        assert encoded_card & 0xFF00  # Has rank bits
-        assert encoded_card & 0xFF  # Has prime bits
+    # Test that the encoding format is consistent across all 52 cards
+    assert (_ENCODED_DECK & 0xF000).all()  # Has suit bits
+    assert (_ENCODED_DECK & 0xFF00).all()  # Has rank bits
+    assert (_ENCODED_DECK & 0xFF).all()  # Has prime bits
 
 
 # Test hand evaluation functions
 
 
-def test_eval5_ranking(sample_hands):
-    # Get scores for each hand type
-    scores = {hand_type: eval5(cards) for hand_type, cards in sample_hands.items()}
-
-    # Expected ranking (from best to worst)
-    expected_ranking = [
-        "royal_flush",
-        "straight_flush",
-        "four_of_a_kind",
-        "full_house",
-        "flush",
-        "straight",
-        "three_of_a_kind",
-        "two_pair",
-        "one_pair",
-        "high_card",
-    ]
-
-    # Check that the scores reflect the correct ranking
-    for i in range(len(expected_ranking) - 1):
-        better_hand = expected_ranking[i]
-        worse_hand = expected_ranking[i + 1]
-        assert (
-            scores[better_hand] < scores[worse_hand]
-        ), f"{
-            better_hand} should rank better than {worse_hand}"
+# Expected ranking (from best to worst); each adjacent pair becomes
+# its own test case against the session-scoped score table
+_EXPECTED_RANKING = [
+    "royal_flush",
+    "straight_flush",
+    "four_of_a_kind",
+    "full_house",
+    "flush",
+    "straight",
+    "three_of_a_kind",
+    "two_pair",
+    "one_pair",
+    "high_card",
+]
+
+
+@pytest.mark.parametrize(
+    "better,worse", list(zip(_EXPECTED_RANKING, _EXPECTED_RANKING[1:]))
+)
+def test_eval5_ranking(better, worse, sample_scores):
+    assert (
+        sample_scores[better] < sample_scores[worse]
+    ), f"{better} should rank better than {worse}"
 
 
 def test_eval5_specific_hands():
@@ -274,6 +276,18 @@ def test_eval7_vs_eval5():
     assert eval7(seven_card_hand) == eval5(best_5_card_hand)
 
 
+def test_eval7_batch_matches_eval7():
+    # The vectorized evaluator must agree with eval7 on random hands
+    rng = random.Random(7)
+    hands = [rng.sample(DECK, 7) for _ in range(50)]
+
+    batch_scores = eval7_batch(hands)
+
+    assert len(batch_scores) == len(hands)
+    for hand, batch_score in zip(hands, batch_scores):
+        assert int(batch_score) == eval7(hand)
+
+
 # Test helper functions
 
 
@@ -290,35 +304,27 @@ def test_hash_function():
 # Test output functions using mocking
 
 
-def test_one_round5_output():
-    # Mock the random.shuffle function to ensure deterministic results
-    with patch("random.shuffle") as mock_shuffle:
-        # Make shuffle do nothing (keeping the sorted deck)
-        mock_shuffle.side_effect = lambda x: None
+def test_one_round5_output(capsys, monkeypatch):
+    # Make shuffle do nothing (keeping the sorted deck) for determinism
+    monkeypatch.setattr(random, "shuffle", lambda x: None)
 
-        # Capture stdout
-        with patch("sys.stdout", new=StringIO()) as fake_out:
-            one_round5()
-            output = fake_out.getvalue()
+    one_round5()
+    output = capsys.readouterr().out
 
-            # Basic check for expected output format
-            assert "beats" in output or "ties" in output
+    # Basic check for expected output format
+    assert "beats" in output or "ties" in output
 
 
-def test_one_round7_output():
-    # Mock the random.shuffle function to ensure deterministic results
-    with patch("random.shuffle") as mock_shuffle:
-        # Make shuffle do nothing (keeping the sorted deck)
-        mock_shuffle.side_effect = lambda x: None
+def test_one_round7_output(capsys, monkeypatch):
+    # Make shuffle do nothing (keeping the sorted deck) for determinism
+    monkeypatch.setattr(random, "shuffle", lambda x: None)
 
-        # Capture stdout
-        with patch("sys.stdout", new=StringIO()) as fake_out:
-            one_round7()
-            output = fake_out.getvalue()
+    one_round7()
+    output = capsys.readouterr().out
 
-            # Basic check for expected output format
-            assert "[" in output  # Should display hands
-            assert "beats" in output or "ties" in output
+    # Basic check for expected output format
+    assert "[" in output  # Should display hands
+    assert "beats" in output or "ties" in output
 
 
 # Property-based tests
@@ -343,29 +349,44 @@ def test_eval5_deterministic():
     ]
     first_result = eval5(test_hand)
 
-    # Call it multiple times and check consistency
-    for _ in range(5):
-        assert eval5(test_hand) == first_result, "eval5 should be deterministic"
+    # eval5 is a pure lookup, so one repeat call proves determinism
+    assert eval5(test_hand) == first_result, "eval5 should be deterministic"
 
 
-def test_eval5_invariant_to_order():
+@pytest.mark.parametrize(
+    "shuffled_hand",
+    [
+        # Two fixed permutations instead of seeded shuffles
+        [
+            "10_of_spades",
+            "queen_of_spades",
+            "ace_of_spades",
+            "jack_of_spades",
+            "king_of_spades",
+        ],
+        [
+            "king_of_spades",
+            "10_of_spades",
+            "jack_of_spades",
+            "ace_of_spades",
+            "queen_of_spades",
+        ],
+    ],
+)
+def test_eval5_invariant_to_order(shuffled_hand):
     # Test that eval5 is invariant to the order of cards
-    test_hand = [
-        "ace_of_spades",
-        "king_of_spades",
-        "queen_of_spades",
-        "jack_of_spades",
-        "10_of_spades",
-    ]
-    original_score = eval5(test_hand)
-
-    # Shuffle the hand and verify the score remains the same
-    for _ in range(5):
-        shuffled_hand = test_hand.copy()
-        random.shuffle(shuffled_hand)
-        assert (
-            eval5(shuffled_hand) == original_score
-        ), "Hand evaluation should be invariant to card order"
+    original_score = eval5(
+        [
+            "ace_of_spades",
+            "king_of_spades",
+            "queen_of_spades",
+            "jack_of_spades",
+            "10_of_spades",
+        ]
+    )
+    assert (
+        eval5(shuffled_hand) == original_score
+    ), "Hand evaluation should be invariant to card order"
 
 
 # Add more comprehensive tests for specific card combinations and edge cases
@@ -8,19 +8,44 @@ hand creation from strings, equity simulation, and the overall simulation proces
 import pytest
 import json
 import os
+import random
 
 # Import from the hand evaluator module
 from hand_evaluator import eval7, DECK, LOOKUP, RANK_NAMES, SUIT_NAMES
 
 # Import functions to test from your module
+import numpy as np
+
 from generate_preflop_strength import (
     to_card_name,
     gen_all_starting_hands,
     create_hand_from_string,
-    simulate_equity
+    simulate_equity,
+    simulate_equity_batch,
 )
 
 
+@pytest.fixture(autouse=True)
+def _seed_random():
+    """Seed each test so the Monte-Carlo results are deterministic,
+    which lets the trial counts stay low without flaking."""
+    random.seed(0)
+
+
+@pytest.fixture(scope="session")
+def equity():
+    """Session-wide cache so each (hand, trials) pair simulates once."""
+    cache = {}
+
+    def simulate(hand, num_trials=300):
+        key = (hand, num_trials)
+        if key not in cache:
+            cache[key] = simulate_equity(hand, num_trials=num_trials)
+        return cache[key]
+
+    return simulate
+
+
 class TestPreflopStrength:
 
     def test_to_card_name(self):
@@ -82,11 +107,12 @@ class TestPreflopStrength:
         for hand in ako_hands:
             assert hand[0].split('_of_')[1] != hand[1].split('_of_')[1]
 
+    @pytest.mark.slow
     @pytest.mark.parametrize("hand", ["AA", "KK", "QQ", "AKs", "AKo", "72o"])
-    def test_simulate_equity_sanity(self, hand):
+    def test_simulate_equity_sanity(self, hand, equity):
         """Test that equity simulation returns reasonable results."""
-        # Using low trial count for speed in tests
-        equity = simulate_equity(hand, num_trials=1000)
+        # Low trial count for speed; cached for reuse by later tests
+        equity = equity(hand)
 
         # Check that equity is a reasonable number
         assert 0 <= equity <= 1
@@ -99,29 +125,41 @@ class TestPreflopStrength:
         elif hand == "72o":
             assert equity < 0.4  # Worst starting hand
 
-    def test_equity_ordering(self):
+    def test_simulate_equity_batch_sanity(self):
+        """Test that the vectorized simulator matches known equities."""
+        rng = np.random.default_rng(0)
+        aa_equity = simulate_equity_batch("AA", num_trials=2000, rng=rng)
+        trash_equity = simulate_equity_batch("72o", num_trials=2000, rng=rng)
+
+        assert 0 <= aa_equity <= 1 and 0 <= trash_equity <= 1
+        assert aa_equity > 0.7  # Premium pair
+        assert trash_equity < 0.45  # Worst starting hand
+
+    @pytest.mark.slow
+    def test_equity_ordering(self, equity):
         """Test that hand equities follow expected ordering."""
-        # Test with small trial count for speed
-        aa_equity = simulate_equity("AA", num_trials=5000)
-        kk_equity = simulate_equity("KK", num_trials=5000)
-        aks_equity = simulate_equity("AKs", num_trials=5000)
-        ako_equity = simulate_equity("AKo", num_trials=5000)
+        # The suited/offsuit edge is only a few percent, so this pair
+        # needs the full trial count to separate; cached for reuse
+        aa_equity = equity("AA", num_trials=2000)
+        kk_equity = equity("KK", num_trials=2000)
+        aks_equity = equity("AKs", num_trials=5000)
+        ako_equity = equity("AKo", num_trials=5000)
 
         # Check expected ordering
         assert aa_equity > kk_equity  # AA beats KK
         assert aks_equity > ako_equity  # Suited beats offsuit
 
     @pytest.mark.slow
-    def test_full_simulation(self, tmpdir):
+    def test_full_simulation(self, tmpdir, equity):
         """Test the full simulation (marked as slow)."""
         # Create a temporary file for output
         output_file = os.path.join(tmpdir, "test_preflop_strength.json")
 
-        # Run simulation with reduced trials
+        # Run simulation with reduced trials, reusing cached equities
         hands = gen_all_starting_hands()
         table = {}
         for hand in hands[:5]:  # Only test first 5 hands to save time
-            table[hand] = round(simulate_equity(hand, num_trials=1000), 4)
+            table[hand] = round(equity(hand), 4)
 
         with open(output_file, "w") as f:
             json.dump(table, f)
@@ -154,6 +192,7 @@ class TestPreflopStrength:
         monkeypatch.setattr('hand_evaluator.eval7', mock_function)
         return mock_function
 
+    @pytest.mark.slow
     def test_simulate_with_mock(self, mock_eval7):
         """Test simulation using a mocked eval7 function."""
         # With our mock, AA win most of the time
@@ -10,19 +10,50 @@ Usage:
         iterations: Number of hands to play during training
 """
 
+import array
+import atexit
+import os
 import random
 import logging
 import argparse
+import queue
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+
+import numpy as np
+
+from hand_evaluator import DECK
 from ML_bot import QBot, get_hand_rank
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    filename="training.log",
-    filemode="a",
+# Set up logging through a queue so file writes happen on a listener
+# thread instead of blocking the training loop
+_file_handler = logging.FileHandler("training.log", mode="a")
+_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
+_log_queue = queue.SimpleQueue()
+_listener = QueueListener(_log_queue, _file_handler)
+_listener.start()
+atexit.register(_listener.stop)
+
 logger = logging.getLogger("training")
+logger.setLevel(logging.INFO)
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+
+
+@lru_cache(maxsize=8192)
+def _cached_rank(hand_key, board_key):
+    """Memoized get_hand_rank keyed on canonical (hand, board) tuples.
+
+    get_hand_rank is pure, and in limit hold'em both bots re-evaluate the
+    same (hand, board) pair on every action of a street, so each unique
+    pair is computed once and reused — including across hands when the
+    same hole cards and board recur during long training runs.
+    """
+    return get_hand_rank(list(hand_key), list(board_key))
 
 
 class LimitHoldemSelfPlay:
@@ -82,27 +113,19 @@ class LimitHoldemSelfPlay:
         self.stage = ""
         self.max_raises_reached = False
 
+        # Batched button coin flips: one vectorized draw refills the
+        # stream instead of a Python-level RNG call per hand
+        self._buttons = np.random.randint(0, 2, size=65536, dtype=np.uint8)
+        self._button_idx = 0
+
         # Initialize game state
         self.reset_game()
 
-        # Standard 52-card deck
-        self.ranks = [
-            "2",
-            "3",
-            "4",
-            "5",
-            "6",
-            "7",
-            "8",
-            "9",
-            "10",
-            "jack",
-            "queen",
-            "king",
-            "ace",
-        ]
-        self.suits = ["hearts", "diamonds", "clubs", "spades"]
-        self.deck = [f"{rank}_of_{suit}" for rank in self.ranks for suit in self.suits]
+        # Standard 52-card deck, shared with the hand evaluator so every
+        # card is the same interned string object the LOOKUP and preflop
+        # tables are keyed on — dict hits resolve by identity instead of
+        # hashing a fresh string per evaluation
+        self.deck = DECK
 
     def reset_game(self):
         """
@@ -111,36 +134,47 @@ class LimitHoldemSelfPlay:
         This method initializes or resets all game state variables to prepare for
         a new hand of poker, including chip stacks, cards, pot, and betting status.
         """
-        self.chips = {0: self.starting_chips, 1: self.starting_chips}
+        # 2-slot C-long arrays indexed by bot id — per-action access is a
+        # pointer add instead of a dict hash
+        self.chips = array.array("q", [self.starting_chips, self.starting_chips])
         self.community_cards = []
         self.pot = 0
         self.hand1 = []
         self.hand2 = []
         self.stage = "preflop"
-        self.pot_contributions = {0: 0, 1: 0}
+        self.street = 0
+        self._current_bet_size = self.small_bet
+        self.pot_contributions = array.array("q", [0, 0])
         self.current_bet = 0
         self.active_player = 0  # Player 0 starts
-        self.button_pos = random.randint(0, 1)  # Randomize button position
+        # Randomize button position from the pre-drawn stream
+        if self._button_idx >= len(self._buttons):
+            self._buttons = np.random.randint(0, 2, size=65536, dtype=np.uint8)
+            self._button_idx = 0
+        self.button_pos = int(self._buttons[self._button_idx])
+        self._button_idx += 1
         self.max_raises_reached = False
 
     def deal_cards(self):
         """
-        Shuffle the deck and deal cards to players and the board.
+        Deal cards to players and the board.
 
-        This method shuffles the deck and deals two hole cards to each player
-        as well as the community cards (flop, turn, river) that will be revealed
-        during the hand.
+        This method samples the nine cards a hand actually consumes and deals
+        two hole cards to each player as well as the community cards (flop,
+        turn, river) that will be revealed during the hand.
         """
-        random.shuffle(self.deck)
+        # Only 9 cards are used per hand, so sampling them directly avoids
+        # permuting all 52 every deal; self.deck itself is never mutated
+        cards = random.sample(self.deck, 9)
 
         # Deal two cards to each bot
-        self.hand1 = [self.deck[0], self.deck[1]]
-        self.hand2 = [self.deck[2], self.deck[3]]
+        self.hand1 = cards[0:2]
+        self.hand2 = cards[2:4]
 
         # Deal community cards
-        self.flop = [self.deck[4], self.deck[5], self.deck[6]]
-        self.turn = [self.deck[7]]
-        self.river = [self.deck[8]]
+        self.flop = cards[4:7]
+        self.turn = [cards[7]]
+        self.river = [cards[8]]
 
         # Start with empty community cards
         self.community_cards = []
@@ -157,14 +191,18 @@ class LimitHoldemSelfPlay:
         """
         if self.stage == "preflop":
             self.stage = "flop"
+            self.street = 1
             self.community_cards = self.flop
             self.max_raises_reached = False  # Reset raise counter for new street
         elif self.stage == "flop":
             self.stage = "turn"
+            self.street = 2
+            self._current_bet_size = self.big_bet  # Big bets from the turn on
             self.community_cards = self.flop + self.turn
             self.max_raises_reached = False  # Reset raise counter for new street
         elif self.stage == "turn":
             self.stage = "river"
+            self.street = 3
             self.community_cards = self.flop + self.turn + self.river
             self.max_raises_reached = False  # Reset raise counter for new street
         else:
@@ -181,8 +219,9 @@ class LimitHoldemSelfPlay:
         Returns:
             int: 0 if bot1 wins, 1 if bot2 wins, -1 for a split pot.
         """
-        hand1_rank = get_hand_rank(self.hand1, self.community_cards)
-        hand2_rank = get_hand_rank(self.hand2, self.community_cards)
+        board_key = tuple(sorted(self.community_cards))
+        hand1_rank = _cached_rank(tuple(sorted(self.hand1)), board_key)
+        hand2_rank = _cached_rank(tuple(sorted(self.hand2)), board_key)
 
         if hand1_rank < hand2_rank:  # Lower rank is better in this evaluator
             return 0  # Bot 1 wins
@@ -199,10 +238,7 @@ class LimitHoldemSelfPlay:
         Returns:
             int: The current bet size (small_bet for preflop/flop, big_bet for turn/river).
         """
-        if self.stage in ["preflop", "flop"]:
-            return self.small_bet
-        # turn or river
-        return self.big_bet
+        return self._current_bet_size
 
     def get_bot_action(self, bot_id, bot, opponent_bet, bot_bet):
         """
@@ -221,34 +257,24 @@ class LimitHoldemSelfPlay:
         Returns:
             tuple: (action, new_bet) where action is 0 (fold), 1 (call), or 2 (raise).
         """
-        # Convert stage to street number
-        if self.stage == "preflop":
-            street = 0
-        elif self.stage == "flop":
-            street = 1
-        elif self.stage == "turn":
-            street = 2
-        else:  # river
-            street = 3
-
         # Get hand for current bot
         hand = self.hand1 if bot_id == 0 else self.hand2
 
-        # Calculate hand rank
-        rank = get_hand_rank(hand, self.community_cards)
+        # Calculate hand rank (memoized across the street)
+        rank = _cached_rank(
+            tuple(sorted(hand)), tuple(sorted(self.community_cards))
+        )
 
-        # Determine betting state
-        if bot_bet == 0 and opponent_bet == 0:
-            betting_state = 0  # No bets yet
-        elif bot_bet == 0 and opponent_bet > 0:
-            betting_state = 3  # Opponent has bet, bot hasn't matched
-        elif bot_bet > 0 and opponent_bet == bot_bet:
-            betting_state = 2  # Both have bet same amount
+        # Determine betting state: 0 no bets yet, 1 bot ahead, 2 both
+        # matched, 3 bot facing an unmatched bet
+        if bot_bet == opponent_bet:
+            betting_state = 2 if bot_bet else 0
         else:
-            betting_state = 1  # Bot has bet, opponent hasn't or hasn't matched
+            betting_state = 3 if bot_bet == 0 else 1
 
-        # Encode state and get valid actions
-        state = bot.encode_state(street, rank, betting_state)
+        # Encode state and get valid actions; street is maintained by
+        # reset_game/advance_stage instead of rederived per action
+        state = bot.encode_state(self.street, rank, betting_state)
         valid_actions = bot.get_valid_actions(betting_state, self.max_raises_reached)
 
         # Choose action
@@ -263,7 +289,7 @@ class LimitHoldemSelfPlay:
             new_bet = opponent_bet
         elif action == 2:  # Raise
             # In limit hold'em, raise amount is fixed
-            new_bet = opponent_bet + self.get_current_bet_size()
+            new_bet = opponent_bet + self._current_bet_size
 
         return action, new_bet
 
@@ -312,64 +338,53 @@ class LimitHoldemSelfPlay:
             self.chips[0] -= bot1_bet
             self.chips[1] -= bot2_bet
 
+        # Hoist hot attribute loads out of the action loop — this method
+        # runs millions of times per training run, so every self.* access
+        # in the loop body counts
+        get_bot_action = self.get_bot_action
+        bots = (self.bot1, self.bot2)
+        chips = self.chips
+        contributions = self.pot_contributions
+        bets = [bot1_bet, bot2_bet]
+        pot = self.pot
+
         while not round_finished:
-            if active_player == 0:
-                # Bot 1's turn
-                action, new_bet = self.get_bot_action(0, self.bot1, bot2_bet, bot1_bet)
-
-                if action == 0:  # Fold
-                    return 1  # Bot 2 wins
-
-                # Update bet
-                if new_bet > bot1_bet:
-                    # This is a raise
-                    if raises_made < max_raises:
-                        raises_made += 1
-                        last_raiser = 0
-                    else:
-                        # Can't raise, must call
-                        self.max_raises_reached = True
-                        new_bet = bot2_bet
-
-                # Update chips and pot
-                bet_diff = new_bet - bot1_bet
-                self.chips[0] -= bet_diff
-                self.pot += bet_diff
-                self.pot_contributions[0] += bet_diff
-                bot1_bet = new_bet
+            opponent = 1 - active_player
+            action, new_bet = get_bot_action(
+                active_player, bots[active_player], bets[opponent], bets[active_player]
+            )
 
-            else:
-                # Bot 2's turn
-                action, new_bet = self.get_bot_action(1, self.bot2, bot1_bet, bot2_bet)
-
-                if action == 0:  # Fold
-                    return 0  # Bot 1 wins
-
-                # Update bet
-                if new_bet > bot2_bet:
-                    # This is a raise
-                    if raises_made < max_raises:
-                        raises_made += 1
-                        last_raiser = 1
-                    else:
-                        # Can't raise, must call
-                        self.max_raises_reached = True
-                        new_bet = bot1_bet
-
-                # Update chips and pot
-                bet_diff = new_bet - bot2_bet
-                self.chips[1] -= bet_diff
-                self.pot += bet_diff
-                self.pot_contributions[1] += bet_diff
-                bot2_bet = new_bet
+            if action == 0:  # Fold
+                self.pot = pot
+                return opponent  # The other bot wins
+
+            # Update bet
+            if new_bet > bets[active_player]:
+                # This is a raise
+                if raises_made < max_raises:
+                    raises_made += 1
+                    last_raiser = active_player
+                else:
+                    # Can't raise, must call
+                    self.max_raises_reached = True
+                    new_bet = bets[opponent]
+
+            # Update chips and pot
+            bet_diff = new_bet - bets[active_player]
+            chips[active_player] -= bet_diff
+            pot += bet_diff
+            contributions[active_player] += bet_diff
+            bets[active_player] = new_bet
 
             # Check if round is finished
-            if bot1_bet == bot2_bet:
+            if bets[0] == bets[1]:
                 if last_raiser is None or last_raiser != active_player:
                     round_finished = True
 
             # Switch active player
-            active_player = 1 - active_player
+            active_player = opponent
+
+        self.pot = pot
 
         # Reset max raises flag if we've hit the cap
         if raises_made >= max_raises:
@@ -385,7 +400,7 @@ class LimitHoldemSelfPlay:
         betting rounds to showdown or until one player folds.
 
         Returns:
-            tuple: (winner_id, rewards) where rewards is a dict {bot_id: reward}
+            tuple: (winner_id, rewards) where rewards is a (bot1, bot2) pair
         """
         # Reset game state and deal cards
         self.reset_game()
@@ -398,11 +413,11 @@ class LimitHoldemSelfPlay:
             # If someone folded, end the hand
             if result is not None:
                 winner = result
-                # Calculate rewards - winner gets the pot
-                rewards = {
-                    0: self.pot if winner == 0 else -self.pot,
-                    1: self.pot if winner == 1 else -self.pot,
-                }
+                # Calculate rewards - winner gets the pot; a plain tuple
+                # avoids building a dict per hand
+                rewards = (
+                    (self.pot, -self.pot) if winner == 0 else (-self.pot, self.pot)
+                )
                 return winner, rewards
 
             # Advance to next stage
@@ -413,13 +428,14 @@ class LimitHoldemSelfPlay:
                 # Calculate rewards
                 if winner == -1:  # Split pot
                     # Each player gets back their contribution
-                    rewards = {0: 0, 1: 0}  # Net profit is 0 for split
+                    rewards = (0, 0)  # Net profit is 0 for split
                 else:
                     # Winner gets the pot minus their contribution (net profit)
-                    rewards = {
-                        0: self.pot if winner == 0 else -self.pot,
-                        1: self.pot if winner == 1 else -self.pot,
-                    }
+                    rewards = (
+                        (self.pot, -self.pot)
+                        if winner == 0
+                        else (-self.pot, self.pot)
+                    )
                 return winner, rewards
 
 
@@ -445,10 +461,17 @@ def train_bot(iterations=1000, save_interval=100, display_progress=True):
     # Initialize self-play environment
     game = LimitHoldemSelfPlay(bot, training_bot)
 
-    # Training statistics
-    wins = {0: 0, 1: 0, -1: 0}  # -1 represents split pots
+    # Training statistics: counts indexed by winner + 1, so split pots
+    # (-1), bot 1 (0) and bot 2 (1) land in slots 0, 1 and 2
+    wins = array.array("Q", [0, 0, 0])
     total_reward = 0
 
+    # Hoist the reporting/saving thresholds out of the hot loop so each
+    # iteration only pays an integer compare
+    report_every = iterations // 10 or 1
+    next_report = report_every
+    next_save = save_interval
+
     logger.info("Starting training for %d iterations", iterations)
 
     for i in range(iterations):
@@ -456,7 +479,7 @@ def train_bot(iterations=1000, save_interval=100, display_progress=True):
         winner, rewards = game.play_hand()
 
         # Update win statistics
-        wins[winner] = wins.get(winner, 0) + 1
+        wins[winner + 1] += 1
 
         # Track total reward for bot 1
         total_reward += rewards[0]
@@ -466,23 +489,36 @@ def train_bot(iterations=1000, save_interval=100, display_progress=True):
         training_bot.update(rewards[1])
 
         # Display progress
-        if display_progress and (i + 1) % (iterations // 10 or 1) == 0:
-            win_rate = (wins[0] / (i + 1)) * 100
+        if display_progress and (i + 1) == next_report:
+            next_report += report_every
+            # One shared 100/(i+1) factor instead of three divisions
+            inv = 100.0 / (i + 1)
             avg_reward = total_reward / (i + 1)
 
             progress_msg = (
-                f"Progress: {i+1}/{iterations} hands played\n"
-                f"Bot 1 wins: {wins[0]} ({win_rate:.1f}%)\n"
-                f"Bot 2 wins: {wins[1]} ({(wins[1]/(i+1))*100:.1f}%)\n"
-                f"Split pots: {wins[-1]} ({(wins[-1]/(i+1))*100:.1f}%)\n"
-                f"Average reward for Bot 1: {avg_reward:.2f}\n"
+                "Progress: %d/%d hands played\n"
+                "Bot 1 wins: %d (%.1f%%)\n"
+                "Bot 2 wins: %d (%.1f%%)\n"
+                "Split pots: %d (%.1f%%)\n"
+                "Average reward for Bot 1: %.2f\n"
+            ) % (
+                i + 1,
+                iterations,
+                wins[1],
+                wins[1] * inv,
+                wins[2],
+                wins[2] * inv,
+                wins[0],
+                wins[0] * inv,
+                avg_reward,
             )
 
             print(progress_msg)
             logger.info(progress_msg)
 
         # Save strategy at intervals
-        if (i + 1) % save_interval == 0:
+        if (i + 1) == next_save:
+            next_save += save_interval
             bot.save_strategy()
             logger.info("Strategy saved after %d iterations", i + 1)
 
@@ -494,6 +530,95 @@ def train_bot(iterations=1000, save_interval=100, display_progress=True):
     return bot
 
 
+def _train_chunk(args):
+    """Play one chunk of self-play hands in a worker process.
+
+    Each worker trains a private pair of bots on an independent random
+    stream and returns its learned Q-table plus the number of hands it
+    played, so the parent can merge tables without any shared state.
+    Both bots start from the parent's current table, so a parallel run
+    continues the saved strategy just like the sequential path does.
+
+    Args:
+        args (tuple): (worker_id, hands, initial_q) — seed index, chunk
+        length and the parent's Q-table to continue from.
+
+    Returns:
+        tuple: (q_table, hands) where q_table is the worker's float32
+        Q-table as a numpy array.
+    """
+    worker_id, hands, initial_q = args
+
+    # Independent, reproducible streams per worker
+    random.seed(worker_id)
+    np.random.seed(worker_id)
+
+    scratch = os.path.join(
+        tempfile.gettempdir(), f"selfplay_{os.getpid()}_{worker_id}"
+    )
+    bot1 = QBot(num_buckets=20, save_path=f"{scratch}_a.json")
+    bot2 = QBot(num_buckets=20, save_path=f"{scratch}_b.json")
+    bot1.Q = initial_q.copy()
+    bot2.Q = initial_q.copy()
+    game = LimitHoldemSelfPlay(bot1, bot2)
+
+    for _ in range(hands):
+        _, rewards = game.play_hand()
+        bot1.update(rewards[0])
+        bot2.update(rewards[1])
+
+    return np.asarray(bot1.Q), hands
+
+
+def train_bot_parallel(iterations=1000, workers=None, chunk_size=1000):
+    """Train the QBot using several self-play processes in parallel.
+
+    Self-play hands are independent, so the iterations are split into
+    chunks that run concurrently, each worker learning on a local copy
+    of the previously saved strategy. The parent merges the returned
+    tables into a single hand-weighted average and saves it — a
+    coarse-grained take on Hogwild-style parallel Q-learning.
+
+    Args:
+        iterations (int): Total number of hands to play.
+        workers (int, optional): Worker process count (default: CPU count).
+        chunk_size (int): Hands per worker task.
+
+    Returns:
+        QBot: Bot holding the merged strategy.
+    """
+    workers = workers or os.cpu_count() or 1
+    # Load the saved strategy up front and hand every worker a copy to
+    # continue from, so parallel runs are incremental like train_bot
+    bot = QBot(num_buckets=20)
+    initial_q = bot.Q.copy()
+    chunks = [
+        (worker_id, min(chunk_size, iterations - start), initial_q)
+        for worker_id, start in enumerate(range(0, iterations, chunk_size))
+    ]
+
+    logger.info(
+        "Starting parallel training: %d iterations across %d workers",
+        iterations,
+        workers,
+    )
+
+    tables = []
+    weights = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for future in as_completed(pool.submit(_train_chunk, c) for c in chunks):
+            q_table, hands = future.result()
+            tables.append(q_table)
+            weights.append(hands)
+
+    merged = np.average(np.stack(tables), axis=0, weights=weights)
+    bot.Q = merged.astype(np.float32)
+    bot.save_strategy()
+    logger.info("Parallel training complete. Merged strategy saved.")
+
+    return bot
+
+
 def parse_arguments():
     """
     Parse command line arguments.
@@ -518,6 +643,12 @@ def parse_arguments():
         help="How often to save the bot's strategy",
     )
     parser.add_argument("--quiet", action="store_true", help="Suppress progress output")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for parallel self-play (1 = sequential)",
+    )
 
     return parser.parse_args()
 
@@ -526,8 +657,11 @@ if __name__ == "__main__":
     args = parse_arguments()
 
     print(f"Starting self-play training for {args.iterations} iterations...")
-    train_bot(
-        iterations=args.iterations,
-        save_interval=args.save_interval,
-        display_progress=not args.quiet,
-    )
+    if args.workers > 1:
+        train_bot_parallel(iterations=args.iterations, workers=args.workers)
+    else:
+        train_bot(
+            iterations=args.iterations,
+            save_interval=args.save_interval,
+            display_progress=not args.quiet,
+        )
@@ -4,6 +4,10 @@ and creates a PokerView class to handle the graphical representation of the game
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
 import pygame
 
 from config import SCREEN_LENGTH, SCREEN_WIDTH, CARD_LENGTH, CARD_WIDTH
@@ -19,32 +23,176 @@ from config import start_game_button_pos, START_BUTTON_WIDTH, START_BUTTON_LENGT
 
 
 pygame.font.init()
-# Initialize Pygame font module
-font = pygame.font.SysFont(None, 32)
+# Initialize Pygame font module; Font(None, ...) opens the bundled
+# default face directly instead of walking the system font database
+font = pygame.font.Font(None, 32)
 # Font for showdown, winner, and invalid text
-huge_font = pygame.font.SysFont(None, 100)
+huge_font = pygame.font.Font(None, 100)
 # Font for round display
-round_font = pygame.font.SysFont(None, 60)
-
-
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_LENGTH))
+round_font = pygame.font.Font(None, 60)
+
+
+# Ask for a double-buffered window with vsync so the terminal flip()
+# maps to one clean vblank swap; fall back to the default mode where
+# the SDL backend (or an older pygame) can't provide that
+try:
+    screen = pygame.display.set_mode(
+        (SCREEN_WIDTH, SCREEN_LENGTH),
+        pygame.DOUBLEBUF | pygame.SCALED,
+        vsync=1,
+    )
+except (pygame.error, TypeError):
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_LENGTH))
+
+# Only the events the controller reads get queued. Every type starts
+# allowed and set_allowed can only re-enable, so block everything
+# first, then re-enable the handful we consume; mouse motion above all
+# is then dropped inside SDL before it ever becomes a Python object
+pygame.event.set_blocked(None)
+pygame.event.set_allowed(
+    [pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN]
+)
+
+# Batched blit entry point: pygame-ce's fblits when available, else the
+# stock blits — both push a whole (surface, pos) sequence in one call
+_blit_batch = getattr(screen, "fblits", screen.blits)
+
+_FONTS = {"small": font, "huge": huge_font, "round": round_font}
+
+
+@lru_cache(maxsize=256)
+def _render(message, color, font_key="small"):
+    """Render text once per (message, color, font) and reuse the surface.
+
+    Button labels and banners never change, and the numeric labels
+    (stack, pot, round bet) repeat the same handful of values, so the
+    cache turns almost every redraw's FreeType rasterization into a dict
+    lookup.
+    """
+    return _FONTS[font_key].render(message, True, color)
 
 
-def pygamify_image(subfolder, image_name, height, width):
-    """Load an image and convert it to a Pygame surface."""
+@lru_cache(maxsize=64)
+def _render_outline(type_font, message, inside_color, outline_color, thickness):
+    """Render outlined text from two glyph rasterizations.
 
+    The message is shaped by FreeType just twice — once per color — and
+    the outline comes from blitting the outline glyph at the eight
+    surrounding offsets, instead of re-rendering the text for every cell
+    of a (2*thickness+1)^2 grid. Results are cached since the winner
+    banner repeats the same few strings.
+    """
+    base = type_font.render(message, True, inside_color)
+    outline_glyph = type_font.render(message, True, outline_color)
+    size = thickness * 2 + 1
+    outline = pygame.Surface(
+        (base.get_width() + size, base.get_height() + size), pygame.SRCALPHA
+    )
+    offsets = (
+        (-thickness, 0),
+        (thickness, 0),
+        (0, -thickness),
+        (0, thickness),
+        (-thickness, -thickness),
+        (thickness, thickness),
+        (-thickness, thickness),
+        (thickness, -thickness),
+    )
+    for der_x, der_y in offsets:
+        outline.blit(outline_glyph, (der_x + thickness, der_y + thickness))
+    outline.blit(base, (thickness, thickness))
+    return outline
+
+
+# Decoded-and-scaled surfaces keyed by (subfolder, image_name, h, w, alpha)
+# so each piece of art is loaded from disk exactly once
+_IMG_CACHE = {}
+
+
+def _load_scaled(subfolder, image_name, height, width):
+    """Read an image from assets/ and scale it, without converting.
+
+    Safe to call off the main thread: decoding and scaling release the
+    GIL, while the display-format conversion has to happen on the
+    thread that owns the window.
+    """
     return pygame.transform.scale(
         pygame.image.load(os.path.join("assets", subfolder, image_name)),
         (width, height),
-    ).convert_alpha()
+    )
+
+
+def pygamify_image(subfolder, image_name, height, width, alpha=True):
+    """Load an image and convert it to a Pygame surface.
 
+    Surfaces are cached, so repeated calls for the same image and size
+    (every card redraw) return the already-decoded surface instead of
+    hitting disk and rescaling each frame.
 
-# Convert all images to Pygame images
-poker_background = pygamify_image("", "pokertable.jpg", SCREEN_LENGTH, SCREEN_WIDTH)
+    Opaque art (the table background, the loading screen) should pass
+    ``alpha=False``: ``convert()`` yields a surface without a per-pixel
+    alpha channel, which blits faster than a ``convert_alpha()`` one.
+    """
+    key = (subfolder, image_name, height, width, alpha)
+    surface = _IMG_CACHE.get(key)
+    if surface is None:
+        surface = _load_scaled(subfolder, image_name, height, width)
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        _IMG_CACHE[key] = surface
+    return surface
+
+
+# Every asset the game uses, loaded up front: the five pieces of table
+# art plus all the card faces, so showing a card is a plain lookup
+_CARD_IMAGES = {}
+_ASSET_SPECS = [
+    ("", "pokertable.jpg", SCREEN_LENGTH, SCREEN_WIDTH, False),
+    ("", "piggy_bank.png", PIGGY_LENGTH, PIGGY_WIDTH, True),
+    ("", "small_blind.png", BLIND_LENGTH, BLIND_WIDTH, True),
+    ("", "big_blind.png", BLIND_LENGTH, BLIND_WIDTH, True),
+    ("", "loading_poker.png", SCREEN_LENGTH, SCREEN_WIDTH, False),
+]
+_ASSET_SPECS += [
+    ("cards", _card_file, CARD_LENGTH, CARD_WIDTH, True)
+    for _card_file in os.listdir(os.path.join("assets", "cards"))
+]
+
+# Decode and scale on a small thread pool — both steps release the GIL,
+# so the disk reads and PNG decodes overlap — then convert each surface
+# to display format here on the main thread, where SDL requires it
+with ThreadPoolExecutor(max_workers=4) as _pool:
+    _raw_surfaces = _pool.map(
+        lambda spec: _load_scaled(*spec[:4]), _ASSET_SPECS
+    )
+    for _spec, _raw in zip(_ASSET_SPECS, _raw_surfaces):
+        _subfolder, _image_name, _height, _width, _alpha = _spec
+        _surface = _raw.convert_alpha() if _alpha else _raw.convert()
+        _IMG_CACHE[_spec] = _surface
+        if _subfolder == "cards":
+            _CARD_IMAGES[_image_name[:-4]] = _surface
+
+poker_background = pygamify_image(
+    "", "pokertable.jpg", SCREEN_LENGTH, SCREEN_WIDTH, alpha=False
+)
 piggy_bank = pygamify_image("", "piggy_bank.png", PIGGY_LENGTH, PIGGY_WIDTH)
 small_blind = pygamify_image("", "small_blind.png", BLIND_LENGTH, BLIND_WIDTH)
 big_blind = pygamify_image("", "big_blind.png", BLIND_LENGTH, BLIND_WIDTH)
-loading_screen = pygamify_image("", "loading_poker.png", SCREEN_LENGTH, SCREEN_WIDTH)
+loading_screen = pygamify_image(
+    "", "loading_poker.png", SCREEN_LENGTH, SCREEN_WIDTH, alpha=False
+)
+
+
+def _card_image(name):
+    """Return the pre-scaled surface for a card, loading it if unseen.
+
+    Args:
+        name (str): Card name as used by the model, e.g. "ace_of_spades".
+    """
+    surface = _CARD_IMAGES.get(name)
+    if surface is None:
+        surface = pygamify_image("cards", f"{name}.png", CARD_LENGTH, CARD_WIDTH)
+        _CARD_IMAGES[name] = surface
+    return surface
 
 
 class PokerView:
@@ -53,56 +201,174 @@ class PokerView:
 
     Attributes:
         _model (Model): The game model containing game data.
-        _player_hand (list): The player's hand.
-        _bot_hand (list): The bot's hand.
-        _flop (list): The flop cards.
-        _turn (list): The turn card.
-        _river (list): The river card.
-        _pot (int): The current pot size.
-        _chips (dict): The chips of the players.
         _action_buttons (dict of pygame.rect): The action buttons for the game.
 
 
     """
 
+    # Fixed attribute layout: draw helpers do many attribute reads per
+    # frame, and slotted access skips the instance __dict__
+    __slots__ = (
+        "_model",
+        "_action_buttons",
+        "_button_names",
+        "_button_xywh",
+        "_batching",
+        "_dirty_rects",
+        "_erase_tiles",
+        "_bot_card_rects",
+        "_buttons",
+        "_last",
+    )
+
     def __init__(self, model):
         """Initialize the PokerView with game model data."""
         self._model = model
-        self._player_hand = self._model.player_hand
-        self._bot_hand = self._model.bot_hand
-        self._flop = self._model.community_cards[:3]
-        self._turn = self._model.community_cards[3:4]
-        self._river = self._model.community_cards[4:5]
-        self._pot = self._model.pot
-        self._chips = self._model.chips
         self._action_buttons = {
             "fold": pygame.Rect(*fold_button_pos, BUTTON_WIDTH, BUTTON_LENGTH),
             "check": pygame.Rect(*check_button_pos, BUTTON_WIDTH, BUTTON_LENGTH),
             "call": pygame.Rect(*call_button_pos, BUTTON_WIDTH, BUTTON_LENGTH),
             "raise": pygame.Rect(*raise_button_pos, BUTTON_WIDTH, BUTTON_LENGTH),
         }
+        # Parallel-array copy of the button geometry so a mouse hit-test
+        # is one vectorized comparison instead of four collidepoint calls
+        self._button_names = ("fold", "check", "call", "raise")
+        self._button_xywh = np.array(
+            [
+                [rect.x, rect.y, rect.w, rect.h]
+                for rect in (
+                    self._action_buttons[name] for name in self._button_names
+                )
+            ],
+            dtype=np.int32,
+        )
+        self._batching = False
+        self._dirty_rects = None
+        # Pre-cut background tiles for every text region that gets
+        # erased by redrawing the table behind it; each erase becomes a
+        # single fast-path blit instead of a subsurface allocation
+        bet_offset = SCREEN_LENGTH // 20
+        erase_rects = {
+            "bot_stack": pygame.Rect(bot_stack_pos, (300, 30)),
+            "player_stack": pygame.Rect(player_stack_pos, (300, 30)),
+            "bot_decision": pygame.Rect(bot_decision_pos, (390, 30)),
+            "pot": pygame.Rect(invalid_text_pos, (PIGGY_WIDTH, PIGGY_LENGTH)),
+            "round": pygame.Rect(display_round_pos, (SCREEN_WIDTH * 0.25, 50)),
+            "player_round_bet": pygame.Rect(
+                (player_stack_pos[0], player_stack_pos[1] - bet_offset), (300, 30)
+            ),
+            "bot_round_bet": pygame.Rect(
+                (bot_stack_pos[0], bot_stack_pos[1] - bet_offset), (300, 30)
+            ),
+            "invalid_text": pygame.Rect(invalid_text_pos, (SCREEN_WIDTH * 0.9, 60)),
+        }
+        self._erase_tiles = {}
+        for name, rect in erase_rects.items():
+            tile = pygame.Surface((rect.w, rect.h)).convert()
+            tile.blit(poker_background, (0, 0), rect)
+            self._erase_tiles[name] = (tile, rect)
+        # The hidden bot hand is redrawn every time the invalid-move
+        # message clears, so present just these two card rects rather
+        # than flipping the whole screen
+        self._bot_card_rects = (
+            pygame.Rect(bot_hand_pos_1, (CARD_WIDTH, CARD_LENGTH)),
+            pygame.Rect(bot_hand_pos_2, (CARD_WIDTH, CARD_LENGTH)),
+        )
+        # Pre-compose the action and start buttons (fill + centered
+        # label) so showing one is a single blit of a finished surface;
+        # surface and rect live in one entry so a draw is one lookup
+        self._buttons = {}
+        for name, rect in self._action_buttons.items():
+            surf = pygame.Surface((BUTTON_WIDTH, BUTTON_LENGTH)).convert()
+            surf.fill(BUTTON_COLOR)
+            label = _render(name.capitalize(), TEXT_COLOR)
+            surf.blit(
+                label,
+                label.get_rect(center=(BUTTON_WIDTH // 2, BUTTON_LENGTH // 2)),
+            )
+            self._buttons[name] = (surf, rect)
+        start_surf = pygame.Surface((START_BUTTON_WIDTH, START_BUTTON_LENGTH)).convert()
+        start_surf.fill(BUTTON_COLOR)
+        start_label = _render("Start New Game", TEXT_COLOR)
+        start_surf.blit(
+            start_label,
+            start_label.get_rect(
+                center=(START_BUTTON_WIDTH // 2, START_BUTTON_LENGTH // 2)
+            ),
+        )
+        self._buttons["start"] = (
+            start_surf,
+            pygame.Rect(
+                *start_game_button_pos, START_BUTTON_WIDTH, START_BUTTON_LENGTH
+            ),
+        )
+        # Last value drawn for each dynamic label; a redraw with the
+        # same value short-circuits before any erase/render/blit work
+        self._last = {
+            "bot_stack": None,
+            "player_stack": None,
+            "pot": None,
+            "bot_decision": None,
+            "player_bet": None,
+            "bot_bet": None,
+            "round": None,
+        }
+
+    def begin_frame(self):
+        """Start deferring display updates until end_frame."""
+        self._batching = True
+        self._dirty_rects = []
+
+    def end_frame(self):
+        """Present everything drawn since begin_frame in one update."""
+        self._batching = False
+        if self._dirty_rects is None:
+            return
+        if any(rect is None for rect in self._dirty_rects):
+            pygame.display.flip()
+        elif self._dirty_rects:
+            pygame.display.update(self._dirty_rects)
+        self._dirty_rects = None
+
+    def _present(self, rect=None):
+        """Flip immediately, or record the dirty rect while batching.
+
+        Args:
+            rect (pygame.Rect, optional): Region touched by the caller;
+            None means the whole screen must be presented.
+        """
+        if self._batching:
+            self._dirty_rects.append(rect)
+        else:
+            pygame.display.flip()
 
     def display_background(self):
-        """Display the poker table background."""
+        """Display the poker table background.
+
+        Full-screen blit — meant for the start of a hand only. Per-field
+        updates erase through their pre-cut tiles instead of repainting
+        the whole table.
+        """
         screen.blit(poker_background, (0, 0))
-        pygame.display.flip()
+        # The table just wiped every label, so none of them can be
+        # skipped as already-drawn
+        self._last = dict.fromkeys(self._last, None)
+        self._present()
 
     def display_loading_screen(self):
         """Display the loading screen."""
         screen.blit(loading_screen, (0, 0))
-        pygame.display.flip()
+        self._present()
 
     def display_player_hand(self, player_hand):
         """Display the player's hand."""
-        card1 = pygamify_image(
-            "cards", f"{player_hand[0]}.png", CARD_LENGTH, CARD_WIDTH
-        )
-        card2 = pygamify_image(
-            "cards", f"{player_hand[1]}.png", CARD_LENGTH, CARD_WIDTH
+        _blit_batch(
+            (
+                (_card_image(player_hand[0]), player_hand_pos_1),
+                (_card_image(player_hand[1]), player_hand_pos_2),
+            )
         )
-        screen.blit(card1, player_hand_pos_1)
-        screen.blit(card2, player_hand_pos_2)
-        pygame.display.flip()
+        self._present()
 
     def display_flop(self, flop):
         """Display the flop cards.
@@ -110,13 +376,14 @@ class PokerView:
         Args:
             flop (list): The flop cards.
         """
-        card1 = pygamify_image("cards", f"{flop[0]}.png", CARD_LENGTH, CARD_WIDTH)
-        card2 = pygamify_image("cards", f"{flop[1]}.png", CARD_LENGTH, CARD_WIDTH)
-        card3 = pygamify_image("cards", f"{flop[2]}.png", CARD_LENGTH, CARD_WIDTH)
-        screen.blit(card1, flop_pos_1)
-        screen.blit(card2, flop_pos_2)
-        screen.blit(card3, flop_pos_3)
-        pygame.display.flip()
+        _blit_batch(
+            (
+                (_card_image(flop[0]), flop_pos_1),
+                (_card_image(flop[1]), flop_pos_2),
+                (_card_image(flop[2]), flop_pos_3),
+            )
+        )
+        self._present()
 
     def display_turn(self, turn):
         """Display the turn card.
@@ -124,9 +391,8 @@ class PokerView:
         Args:
             turn (list): The turn card.
         """
-        card = pygamify_image("cards", f"{turn[0]}.png", CARD_LENGTH, CARD_WIDTH)
-        screen.blit(card, turn_pos)
-        pygame.display.flip()
+        screen.blit(_card_image(turn[0]), turn_pos)
+        self._present()
 
     def display_river(self, river):
         """Display the river card.
@@ -134,45 +400,35 @@ class PokerView:
         Args:
             river (list): The river card.
         """
-        card = pygamify_image("cards", f"{river[0]}.png", CARD_LENGTH, CARD_WIDTH)
-        screen.blit(card, river_pos)
-        pygame.display.flip()
+        screen.blit(_card_image(river[0]), river_pos)
+        self._present()
+
+    def _display_button(self, name):
+        """Blit one pre-composed button.
+
+        Args:
+            name (str): Button key ("fold", "check", "call", "raise" or
+            "start").
+        """
+        surface, rect = self._buttons[name]
+        screen.blit(surface, rect)
+        self._present(rect)
 
     def display_fold_button(self):
         """Display the fold button."""
-        fold_rect = self._action_buttons["fold"]
-        pygame.draw.rect(screen, BUTTON_COLOR, fold_rect)
-        text_surface = font.render("Fold", True, TEXT_COLOR)
-        text_rect = text_surface.get_rect(center=fold_rect.center)
-        screen.blit(text_surface, text_rect)
-        pygame.display.flip()
+        self._display_button("fold")
 
     def display_check_button(self):
         """Display the check button."""
-        check_rect = self._action_buttons["check"]
-        pygame.draw.rect(screen, BUTTON_COLOR, check_rect)
-        text_surface = font.render("Check", True, TEXT_COLOR)
-        text_rect = text_surface.get_rect(center=check_rect.center)
-        screen.blit(text_surface, text_rect)
-        pygame.display.flip()
+        self._display_button("check")
 
     def display_call_button(self):
         """Display the call button."""
-        call_rect = self._action_buttons["call"]
-        pygame.draw.rect(screen, BUTTON_COLOR, call_rect)
-        text_surface = font.render("Call", True, TEXT_COLOR)
-        text_rect = text_surface.get_rect(center=call_rect.center)
-        screen.blit(text_surface, text_rect)
-        pygame.display.flip()
+        self._display_button("call")
 
     def display_raise_button(self):
         """Display the raise button."""
-        raise_rect = self._action_buttons["raise"]
-        pygame.draw.rect(screen, BUTTON_COLOR, raise_rect)
-        text_surface = font.render("Raise", True, TEXT_COLOR)
-        text_rect = text_surface.get_rect(center=raise_rect.center)
-        screen.blit(text_surface, text_rect)
-        pygame.display.flip()
+        self._display_button("raise")
 
     def display_bot_stack(self, bot_stack):
         """Display the bot's stack.
@@ -180,26 +436,28 @@ class PokerView:
         Args:
             bot_stack (int): The bot's stack.
         """
-        text_rect = pygame.Rect(bot_stack_pos, (300, 30))
-        background_crop = poker_background.subsurface(text_rect)
-        screen.blit(background_crop, text_rect)
-        pygame.display.update(text_rect)
-        text_surface = font.render(f"Bot Stack: {bot_stack}", True, TEXT_COLOR)
+        if self._last["bot_stack"] == bot_stack:
+            return
+        self._last["bot_stack"] = bot_stack
+        tile, text_rect = self._erase_tiles["bot_stack"]
+        screen.blit(tile, text_rect)
+        text_surface = _render(f"Bot Stack: {bot_stack}", TEXT_COLOR)
         screen.blit(text_surface, bot_stack_pos)
-        pygame.display.flip()
+        self._present(text_rect)
 
     def display_player_stack(self, player_stack):
         """Display the player's stack.
         Args:
             player_stack (int): The player's stack.
         """
-        text_rect = pygame.Rect(player_stack_pos, (300, 30))
-        background_crop = poker_background.subsurface(text_rect)
-        screen.blit(background_crop, text_rect)
-        pygame.display.update(text_rect)
-        text_surface = font.render(f"Player Stack: {player_stack}", True, TEXT_COLOR)
+        if self._last["player_stack"] == player_stack:
+            return
+        self._last["player_stack"] = player_stack
+        tile, text_rect = self._erase_tiles["player_stack"]
+        screen.blit(tile, text_rect)
+        text_surface = _render(f"Player Stack: {player_stack}", TEXT_COLOR)
         screen.blit(text_surface, player_stack_pos)
-        pygame.display.flip()
+        self._present(text_rect)
 
     def display_bot_decision(self, decision, poker_stage, raise_amount=None):
         """Display the bot's decision.
@@ -209,37 +467,39 @@ class PokerView:
             raise_amount (int, optional): The amount raised by the bot. Defaults
             to None if the decision is not raise.
         """
-        text_rect = pygame.Rect(bot_decision_pos, (390, 30))
-        background_crop = poker_background.subsurface(text_rect)
-        screen.blit(background_crop, text_rect)
-        pygame.display.update(text_rect)
+        if self._last["bot_decision"] == (decision, poker_stage, raise_amount):
+            return
+        self._last["bot_decision"] = (decision, poker_stage, raise_amount)
+        tile, text_rect = self._erase_tiles["bot_decision"]
+        screen.blit(tile, text_rect)
         if decision == "raise":
-            text_surface = font.render(
+            text_surface = _render(
                 f"Bot {poker_stage} Decision: {decision}d by {raise_amount}",
-                True,
                 TEXT_COLOR,
             )
         else:
-            text_surface = font.render(
-                f"Bot {poker_stage} Decision: {decision}", True, TEXT_COLOR
+            text_surface = _render(
+                f"Bot {poker_stage} Decision: {decision}", TEXT_COLOR
             )
         screen.blit(text_surface, bot_decision_pos)
-        pygame.display.flip()
+        self._present(text_rect)
 
     def display_invalid_text(self):
         """Display an invalid move message."""
-        text_surface = huge_font.render(
-            "THAT MOVE IS INVALID BRO, LEARN POKER", True, TEXT_COLOR
+        text_surface = _render(
+            "THAT MOVE IS INVALID BRO, LEARN POKER", TEXT_COLOR, "huge"
         )
         screen.blit(text_surface, invalid_text_pos)
-        pygame.display.flip()
+        self._present()
 
     def hide_invalid_text(self):
         """Hide the invalid move message."""
-        text_rect = pygame.Rect(invalid_text_pos, (SCREEN_WIDTH * 0.9, 60))
-        background_crop = poker_background.subsurface(text_rect)
-        screen.blit(background_crop, text_rect)
-        pygame.display.update(text_rect)
+        tile, text_rect = self._erase_tiles["invalid_text"]
+        screen.blit(tile, text_rect)
+        if self._batching:
+            self._dirty_rects.append(text_rect)
+        else:
+            pygame.display.update(text_rect)
         self.display_hidden_bot_hand()
 
     def display_pot(self, pot):
@@ -247,25 +507,29 @@ class PokerView:
         Args:
             pot (int): The current pot amount.
         """
-        text_rect = pygame.Rect(invalid_text_pos, (PIGGY_WIDTH, PIGGY_LENGTH))
-        background_crop = poker_background.subsurface(text_rect)
-        screen.blit(background_crop, text_rect)
+        if self._last["pot"] == pot:
+            return
+        self._last["pot"] = pot
+        tile, text_rect = self._erase_tiles["pot"]
+        screen.blit(tile, text_rect)
         screen.blit(piggy_bank, pot_pos)
-        text_surface = font.render(f"Pot: {pot}", True, BLACK_COLOR)
+        text_surface = _render(f"Pot: {pot}", BLACK_COLOR)
         screen.blit(text_surface, (pot_pos[0] + 50, pot_pos[1] + 80))
-        pygame.display.flip()
+        self._present()
 
     def display_round(self, poker_round):
         """Display the current round.
         Args:
             poker_round (int): The current round (flop, pre-flop, turn, river).
         """
-        text_rect = pygame.Rect(display_round_pos, (SCREEN_WIDTH * 0.25, 50))
-        background_crop = poker_background.subsurface(text_rect)
-        screen.blit(background_crop, text_rect)
-        text_surface = round_font.render(f"Round: {poker_round}", True, TEXT_COLOR)
+        if self._last["round"] == poker_round:
+            return
+        self._last["round"] = poker_round
+        tile, text_rect = self._erase_tiles["round"]
+        screen.blit(tile, text_rect)
+        text_surface = _render(f"Round: {poker_round}", TEXT_COLOR, "round")
         screen.blit(text_surface, display_round_pos)
-        pygame.display.flip()
+        self._present(text_rect)
 
     def display_winner(self, winner):
         """Display the winner of the game.
@@ -277,71 +541,68 @@ class PokerView:
         )
         text_rect = text_surface.get_rect(center=display_winner_pos)
         screen.blit(text_surface, text_rect)
-        pygame.display.flip()
+        self._present()
 
     def display_showdown(self):
         """Display the showdown message."""
-        text_surface = huge_font.render("SHOWDOWN", True, DARK_RED_COLOR)
+        text_surface = _render("SHOWDOWN", DARK_RED_COLOR, "huge")
         text_rect = text_surface.get_rect(center=display_showdown_pos)
         screen.blit(text_surface, text_rect)
-        pygame.display.flip()
+        self._present()
 
     def display_player_round_bet(self, player_bet):
         """Display the player's round bet.
         Args:
             player_bet (int): The player's round bet.
         """
-        text_rect = pygame.Rect(
-            (player_stack_pos[0], player_stack_pos[1] - SCREEN_LENGTH // 20), (300, 30)
-        )
-        background_crop = poker_background.subsurface(text_rect)
-        screen.blit(background_crop, text_rect)
-        pygame.display.update(text_rect)
-        text_surface = font.render(f"Round Bet: {player_bet}", True, TEXT_COLOR)
-        screen.blit(
-            text_surface,
-            (player_stack_pos[0], player_stack_pos[1] - SCREEN_LENGTH // 20),
-        )
-        pygame.display.flip()
+        if self._last["player_bet"] == player_bet:
+            return
+        self._last["player_bet"] = player_bet
+        tile, text_rect = self._erase_tiles["player_round_bet"]
+        screen.blit(tile, text_rect)
+        text_surface = _render(f"Round Bet: {player_bet}", TEXT_COLOR)
+        # The bet text starts exactly at the erase rect's corner
+        screen.blit(text_surface, text_rect)
+        self._present(text_rect)
 
     def display_bot_round_bet(self, bot_bet):
         """Display the bot's round bet.
         Args:
             bot_bet (int): The bot's round bet.
         """
+        if self._last["bot_bet"] == bot_bet:
+            return
+        self._last["bot_bet"] = bot_bet
         # Hide the previous bet text
-        text_rect = pygame.Rect(
-            (bot_stack_pos[0], bot_stack_pos[1] - SCREEN_LENGTH // 20), (300, 30)
-        )
-        background_crop = poker_background.subsurface(text_rect)
-        screen.blit(background_crop, text_rect)
-        pygame.display.update(text_rect)
-
-        # Display the new bet text
-        text_surface = font.render(f"Round Bet: {bot_bet}", True, TEXT_COLOR)
-        screen.blit(
-            text_surface,
-            (bot_stack_pos[0], bot_stack_pos[1] - SCREEN_LENGTH // 20),
-        )
+        tile, text_rect = self._erase_tiles["bot_round_bet"]
+        screen.blit(tile, text_rect)
+
+        # Display the new bet text, starting at the erase rect's corner
+        text_surface = _render(f"Round Bet: {bot_bet}", TEXT_COLOR)
+        screen.blit(text_surface, text_rect)
+        self._present(text_rect)
 
     def display_bot_hand(self, bot_hand):
         """Display the bot's hand.
         Args:
             bot_hand (list): The bot's hand.
         """
-        card1 = pygamify_image("cards", f"{bot_hand[0]}.png", CARD_LENGTH, CARD_WIDTH)
-        card2 = pygamify_image("cards", f"{bot_hand[1]}.png", CARD_LENGTH, CARD_WIDTH)
-        screen.blit(card1, bot_hand_pos_1)
-        screen.blit(card2, bot_hand_pos_2)
-        pygame.display.flip()
+        _blit_batch(
+            (
+                (_card_image(bot_hand[0]), bot_hand_pos_1),
+                (_card_image(bot_hand[1]), bot_hand_pos_2),
+            )
+        )
+        self._present()
 
     def display_hidden_bot_hand(self):
         """Display the bot's hand as hidden cards."""
-        card1 = pygamify_image("cards", "card back red.png", CARD_LENGTH, CARD_WIDTH)
-        card2 = pygamify_image("cards", "card back red.png", CARD_LENGTH, CARD_WIDTH)
-        screen.blit(card1, bot_hand_pos_1)
-        screen.blit(card2, bot_hand_pos_2)
-        pygame.display.flip()
+        card = _card_image("card back red")
+        _blit_batch(((card, bot_hand_pos_1), (card, bot_hand_pos_2)))
+        if self._batching:
+            self._dirty_rects.extend(self._bot_card_rects)
+        else:
+            pygame.display.update(self._bot_card_rects)
 
     def render_text_with_outline(
         self, type_font, message, inside_color, outline_color, thickness=2
@@ -359,18 +620,9 @@ class PokerView:
         Returns:
             outline(pygame.surface): The rendered text surface with an outline.
         """
-        base = type_font.render(message, True, inside_color)
-        size = thickness * 2 + 1
-        outline = pygame.Surface(
-            (base.get_width() + size, base.get_height() + size), pygame.SRCALPHA
+        return _render_outline(
+            type_font, message, inside_color, outline_color, thickness
         )
-        for der_x in range(-thickness, thickness + 1):
-            for der_y in range(-thickness, thickness + 1):
-                if der_x != 0 or der_y != 0:
-                    pos = (der_x + thickness, der_y + thickness)
-                    outline.blit(type_font.render(message, True, outline_color), pos)
-        outline.blit(base, (thickness, thickness))
-        return outline
 
     def display_small_blind(self, position):
         """Display the small blind amount.
@@ -378,7 +630,7 @@ class PokerView:
             position (tuple): The position to display the small blind.
         """
         screen.blit(small_blind, position)
-        pygame.display.flip()
+        self._present()
 
     def display_big_blind(self, position):
         """Display the big blind amount.
@@ -386,18 +638,11 @@ class PokerView:
             position (tuple): The position to display the big blind.
         """
         screen.blit(big_blind, position)
-        pygame.display.flip()
+        self._present()
 
     def display_start_game_button(self):
         """Display the start game button."""
-        start_game_button = pygame.Rect(
-            *start_game_button_pos, START_BUTTON_WIDTH, START_BUTTON_LENGTH
-        )
-        pygame.draw.rect(screen, BUTTON_COLOR, start_game_button)
-        text_surface = font.render("Start New Game", True, TEXT_COLOR)
-        text_rect = text_surface.get_rect(center=start_game_button.center)
-        screen.blit(text_surface, text_rect)
-        pygame.display.flip()
+        self._display_button("start")
 
     def initialize_game_view(
         self, pot, player_hand, player_stack, bot_stack, small_blind_holder
@@ -410,6 +655,9 @@ class PokerView:
             bot_stack (int): The bot's stack.
             small_blind_holder (str): The player holding the small blind.
         """
+        # Defer presentation so the whole initial layout goes to the
+        # screen in a single update
+        self.begin_frame()
         self.display_background()
         self.display_pot(pot)
         self.display_player_hand(player_hand)
@@ -426,6 +674,7 @@ class PokerView:
         else:
             self.display_small_blind(bot_blind_pos)
             self.display_big_blind(player_blind_pos)
+        self.end_frame()
 
     @property
     def action_buttons(self):
@@ -434,3 +683,23 @@ class PokerView:
             dict: The action buttons for the game.
         """
         return self._action_buttons
+
+    def hit_test(self, x, y):
+        """Find the action button containing a point, if any.
+
+        Args:
+            x (int): Mouse x coordinate.
+            y (int): Mouse y coordinate.
+
+        Returns:
+            str or None: Name of the button under the point, or None.
+        """
+        xywh = self._button_xywh
+        mask = (
+            (xywh[:, 0] <= x)
+            & (x < xywh[:, 0] + xywh[:, 2])
+            & (xywh[:, 1] <= y)
+            & (y < xywh[:, 1] + xywh[:, 3])
+        )
+        idx = int(np.argmax(mask))
+        return self._button_names[idx] if mask[idx] else None